@@ -87,6 +87,17 @@ class StatusPacket:
     valve_enabled: int = 1  # 0 when emergency stop active
     valve_ms: int = 0  # How long valve has been open (ms)
 
+    def __str__(self) -> str:
+        """Wire-format line (without newline), for display."""
+        return (
+            f"$STS,{self.limit},"
+            f"{self.servo_positions[0]:.1f},"
+            f"{self.servo_positions[1]:.1f},"
+            f"{self.servo_positions[2]:.1f},"
+            f"{self.light_state},{self.flags},{self.test_active},"
+            f"{self.valve_open},{self.valve_enabled},{self.valve_ms}"
+        )
+
     @classmethod
     def decode(cls, data: bytes) -> Optional["StatusPacket"]:
         """
@@ -74,10 +74,14 @@ class MockSerial:
 
     def write(self, data: bytes) -> int:
         """Process written data and simulate ESP32 response."""
-        # Parse command to update simulated state
-        try:
-            line = data.decode("ascii").strip()
+        # One write may carry several newline-terminated messages
+        for line in data.decode("ascii", errors="ignore").splitlines():
+            self._handle_line(line.strip())
+        return len(data)
 
+    def _handle_line(self, line: str) -> None:
+        """Parse one command line to update simulated state."""
+        try:
             if line.startswith("$SRV,"):
                 # Servo command: $SRV,<s1>,<s2>,<s3>
                 parts = line[5:].split(",")
@@ -118,8 +122,6 @@ class MockSerial:
         except Exception:
             pass
 
-        return len(data)
-
     def close(self) -> None:
         """Close mock port."""
         self.is_open = False
@@ -162,7 +164,7 @@ class UartComm(threading.Thread):
     - Sending servo commands at regular intervals (heartbeat)
     - Sending other commands on change
     - Receiving and parsing status packets from ESP32
-    - Connection monitoring
+    - Timestamping packets (EspState.connected derives link status from them)
     - Mock mode for testing without hardware
     """
 
@@ -182,6 +184,7 @@ class UartComm(threading.Thread):
 
         self.serial: Optional[object] = None  # serial.Serial or MockSerial
         self.tx_interval = 1.0 / config.UART_TX_RATE_HZ
+        self.poll_interval = getattr(config, 'UART_POLL_INTERVAL', 0.005)
         self.last_tx_time = 0.0
 
         # Track last sent values to detect changes
@@ -226,20 +229,22 @@ class UartComm(threading.Thread):
 
         while not self.stop_event.is_set():
             try:
+                # One clock read stamps RX and schedules TX for this iteration
+                now = time.monotonic()
+
                 # Receive data
-                self._receive()
+                self._receive(now)
 
                 # Send commands at regular interval
-                now = time.time()
                 if now - self.last_tx_time >= self.tx_interval:
                     self._transmit()
                     self.last_tx_time = now
 
-                # Check connection status
-                self.state.check_esp_connection(config.UART_CONNECTION_TIMEOUT_MS)
-
-                # Small sleep to prevent busy-waiting
-                time.sleep(0.001)
+                # Block until the next TX is due (bounded so RX stays responsive);
+                # stop_event wakes us immediately on shutdown. Re-read the clock
+                # so time spent in RX/TX above is not slept again.
+                next_tx_in = self.tx_interval - (time.monotonic() - self.last_tx_time)
+                self.stop_event.wait(min(self.poll_interval, max(0.0, next_tx_in)))
 
             except Exception as e:
                 logger.error(f"UART error: {e}")
@@ -393,8 +398,12 @@ class UartComm(threading.Thread):
         # Reset last sent state to force all values to be sent
         self._last_sent = LastSentState()
 
-    def _receive(self) -> None:
-        """Receive and process data from UART."""
+    def _receive(self, now: float) -> None:
+        """Receive and process data from UART.
+
+        Args:
+            now: time.monotonic() reading for this loop iteration
+        """
         if not self.serial:
             return
 
@@ -409,8 +418,16 @@ class UartComm(threading.Thread):
                 # Feed to protocol parser
                 packets = self.protocol.feed(data)
 
-                # Process received packets
                 for packet in packets:
+                    logger.debug(
+                        f"RX: limit={packet.limit}, servos={packet.servo_positions}, "
+                        f"valve_open={packet.valve_open}, valve_ms={packet.valve_ms}"
+                    )
+
+                # A burst carries successive status reports; only the newest
+                # one matters, so publish it once for the whole batch
+                if packets:
+                    packet = packets[-1]
                     self.state.update_esp_from_packet(
                         limit=packet.limit,
                         servo_positions=packet.servo_positions,
@@ -420,20 +437,9 @@ class UartComm(threading.Thread):
                         valve_open=packet.valve_open,
                         valve_enabled=packet.valve_enabled,
                         valve_ms=packet.valve_ms,
+                        timestamp=now,
                     )
-                    rx_str = (
-                        f"$STS,{packet.limit},"
-                        f"{packet.servo_positions[0]:.1f},"
-                        f"{packet.servo_positions[1]:.1f},"
-                        f"{packet.servo_positions[2]:.1f},"
-                        f"{packet.light_state},{packet.flags},{packet.test_active},"
-                        f"{packet.valve_open},{packet.valve_enabled},{packet.valve_ms}"
-                    )
-                    self.state.increment_uart_rx(rx_str)
-                    logger.debug(
-                        f"RX: limit={packet.limit}, servos={packet.servo_positions}, "
-                        f"valve_open={packet.valve_open}, valve_ms={packet.valve_ms}"
-                    )
+                    self.state.increment_uart_rx(packet, count=len(packets))
 
         except Exception as e:
             logger.error(f"UART receive error: {e}")
@@ -449,37 +455,45 @@ class UartComm(threading.Thread):
             # Get current command state
             command = self.state.get_command()
 
-            # Always send servo command as heartbeat
-            self._send_servo_message(command)
+            # Always send servo command as heartbeat, other messages only on
+            # change; everything for this period goes out in a single write
+            packets: list[bytes] = []
+            self._queue_servo_message(command, packets)
+            self._queue_changed_messages(command, packets)
+
+            try:
+                self.serial.write(b"".join(packets))
+            except Exception:
+                # Unknown how much arrived: resend every value once reconnected
+                self._last_sent = LastSentState()
+                raise
 
-            # Send other messages only on change
-            self._send_if_changed(command)
+            for packet in packets:
+                self.state.increment_uart_tx(packet)
 
         except Exception as e:
             logger.error(f"UART transmit error: {e}")
             if not self.mock_mode:
                 raise
 
-    def _send_servo_message(self, command: CommandState) -> None:
-        """Send servo target message (always sent as heartbeat)."""
+    def _queue_servo_message(self, command: CommandState, out: list[bytes]) -> None:
+        """Queue servo target message (always sent as heartbeat)."""
         packet = self.protocol.create_servo_message(
             command.servo_targets[0],
             command.servo_targets[1],
             command.servo_targets[2],
         )
-        self.serial.write(packet)
-        self.state.increment_uart_tx(packet.decode("ascii"))
+        out.append(packet)
         logger.debug(f"TX SRV: {command.servo_targets}")
 
-    def _send_if_changed(self, command: CommandState) -> None:
-        """Send messages for values that have changed."""
+    def _queue_changed_messages(self, command: CommandState, out: list[bytes]) -> None:
+        """Queue messages for values that have changed."""
         last = self._last_sent
 
         # Light command
         if command.light_command != last.light_command:
             packet = self.protocol.create_light_message(command.light_command)
-            self.serial.write(packet)
-            self.state.increment_uart_tx(packet.decode("ascii"))
+            out.append(packet)
             last.light_command = command.light_command
             logger.debug(f"TX LGT: {command.light_command}")
 
@@ -491,8 +505,7 @@ class UartComm(threading.Thread):
             packet = self.protocol.create_rgb_message(
                 command.rgb_mode, command.rgb_r, command.rgb_g, command.rgb_b
             )
-            self.serial.write(packet)
-            self.state.increment_uart_tx(packet.decode("ascii"))
+            out.append(packet)
             last.rgb_mode = command.rgb_mode
             last.rgb_r = command.rgb_r
             last.rgb_g = command.rgb_g
@@ -505,8 +518,7 @@ class UartComm(threading.Thread):
             packet = self.protocol.create_matrix_message(
                 command.matrix_left, command.matrix_right
             )
-            self.serial.write(packet)
-            self.state.increment_uart_tx(packet.decode("ascii"))
+            out.append(packet)
             last.matrix_left = command.matrix_left
             last.matrix_right = command.matrix_right
             logger.debug(f"TX MTX: ({command.matrix_left},{command.matrix_right})")
@@ -521,8 +533,7 @@ class UartComm(threading.Thread):
                 command.npm_mode, command.npm_letter,
                 command.npm_r, command.npm_g, command.npm_b
             )
-            self.serial.write(packet)
-            self.state.increment_uart_tx(packet.decode("ascii"))
+            out.append(packet)
             last.npm_mode = command.npm_mode
             last.npm_letter = command.npm_letter
             last.npm_r = command.npm_r
@@ -538,8 +549,7 @@ class UartComm(threading.Thread):
             packet = self.protocol.create_npr_message(
                 command.npr_mode, command.npr_r, command.npr_g, command.npr_b
             )
-            self.serial.write(packet)
-            self.state.increment_uart_tx(packet.decode("ascii"))
+            out.append(packet)
             last.npr_mode = command.npr_mode
             last.npr_r = command.npr_r
             last.npr_g = command.npr_g
@@ -549,15 +559,13 @@ class UartComm(threading.Thread):
         # Valve (simplified: just open/close, no estop)
         if command.valve_open != last.valve_open:
             packet = self.protocol.create_valve_message(command.valve_open)
-            self.serial.write(packet)
-            self.state.increment_uart_tx(packet.decode("ascii"))
+            out.append(packet)
             last.valve_open = command.valve_open
             logger.debug(f"TX VLV: {command.valve_open}")
 
         # Flags (for LED test, etc.)
         if command.flags != last.flags:
             packet = self.protocol.create_flags_message(command.flags)
-            self.serial.write(packet)
-            self.state.increment_uart_tx(packet.decode("ascii"))
+            out.append(packet)
             last.flags = command.flags
             logger.debug(f"TX FLG: {command.flags}")
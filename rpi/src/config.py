@@ -102,6 +102,9 @@ CAMERA_WIDTH = 640
 CAMERA_HEIGHT = 480
 CAMERA_FPS = 30
 CAMERA_MAX_FAILURES = 30  # Consecutive failures before declaring disconnect (~1s at 30fps)
+CAMERA_BUFFER_SIZE = 1    # Driver-side frame queue depth (1 = always process the freshest frame)
+CAMERA_FOURCC = "MJPG"    # Pixel format requested from camera (None = driver default)
+VISION_PROCESS_FPS = 30   # Max frames/sec decoded and processed (extra frames are grabbed and dropped)
 
 # Camera crop settings (percentage of frame to remove from each edge)
 # Useful for excluding enclosure edges, reflections, or irrelevant areas
@@ -147,12 +150,23 @@ CAMERA_GAIN = None            # Gain/ISO override (None = don't change)
 #   - Door closed typically has std dev ~5-15
 #   - Door open typically has std dev ~30+
 #
+# DARK_CHECK_SCALE: Fraction of resolution the brightness stats are computed on
+#   - Pixels are subsampled (nearest neighbour), so percentile/std stay representative
+#   - 1.0 = full frame (what the thresholds above were calibrated on)
+#   - 0.25 = 1/16 of the pixels; re-check thresholds with test_brightness.py first
+#
 # Tuning: Use test_brightness.py to find optimal values for your setup
 DARK_THRESHOLD = 60  # 0-255 scale - raised from 15 to tolerate some internal LED light
 DARK_PERCENTILE = 75  # Use 75th percentile (robust to bright LED spots)
 DARK_USE_VARIANCE = True  # Set True to also check color uniformity
 DARK_VARIANCE_THRESHOLD = 50  # Std dev below this = uniform (door closed)
 DARK_TO_INACTIVE_DURATION = 1.0  # Seconds of darkness before transitioning to INACTIVE
+DARK_CHECK_SCALE = 1.0  # Subsample factor for brightness/variance stats (opt-in)
+
+# OpenCV transparent API: run the dark-check resize/cvtColor through OpenCL
+# when a device is available (x86 iGPU; most Pi OpenCV builds have none).
+# Detector preprocessing stays on host arrays.
+USE_OPENCL = False
 
 # Platform-specific camera backend
 if IS_WINDOWS:
@@ -173,6 +187,7 @@ UART_BAUDRATE = 115200
 UART_TIMEOUT = 0.01  # seconds
 UART_TX_RATE_HZ = 30
 UART_CONNECTION_TIMEOUT_MS = 500
+UART_POLL_INTERVAL = 0.005  # seconds - max wait between RX polls (TX deadlines wake sooner)
 
 # Enable mock UART for testing without hardware
 UART_MOCK_ENABLED = False  # Set True to simulate ESP32 responses
@@ -184,10 +199,26 @@ FACE_DETECTION_CONFIDENCE = 0.3
 FACE_TRACKING_CONFIDENCE = 0.3
 MAX_NUM_FACES = 4
 
+# Face detector feeding the MediaPipe pose estimator:
+# 'yolo' (robust, long range) or 'lbp' (OpenCV LBP cascade, much faster on Pi, frontal only)
+FACE_DETECTOR = 'yolo'
+
 # YOLO Face Detection (hybrid mode)
 # Model size: 'n' (nano/fast), 's' (small/balanced), 'm' (medium/accurate), 'l' (large/best)
 YOLO_MODEL_SIZE = 'n'  # 'small' - good balance of speed and distance detection
 
+# Optional export of the YOLO model to a faster CPU backend, sized to the first
+# processed frame and cached ('ncnn' is usually fastest on Raspberry Pi;
+# None = run the .pt model).
+# INT8 quantization roughly doubles throughput on ARM where the backend supports it.
+YOLO_EXPORT_FORMAT = None
+YOLO_EXPORT_INT8 = False
+
+# Detection resolution as a fraction of the frame (1.0 = full resolution).
+# 0.5 runs the detector on ~4x fewer pixels; pose estimation still uses the
+# full-resolution face crop, and bboxes/landmarks stay in frame coordinates.
+DETECT_SCALE = 1.0
+
 # Minimum face width as ratio of frame width (reject faces smaller than this)
 # 0.05 = 5% = ~32 pixels on 640px frame - filters small false positives
 MIN_FACE_WIDTH_RATIO = 0.04
@@ -44,6 +44,7 @@ class VisionThread(threading.Thread):
     DARK_PERCENTILE = getattr(config, 'DARK_PERCENTILE', 75)
     DARK_USE_VARIANCE = getattr(config, 'DARK_USE_VARIANCE', False)
     DARK_VARIANCE_THRESHOLD = getattr(config, 'DARK_VARIANCE_THRESHOLD', 20)
+    DARK_CHECK_SCALE = getattr(config, 'DARK_CHECK_SCALE', 1.0)
 
     # Camera connection tracking - use config value or default
     MAX_CONSECUTIVE_FAILURES = getattr(config, 'CAMERA_MAX_FAILURES', 30)
@@ -65,9 +66,10 @@ class VisionThread(threading.Thread):
         self.cap: Optional[cv2.VideoCapture] = None
         self.tracker: Optional[FaceTracker] = None
 
-        # FPS tracking (same as vision_servo_test.py)
-        self.fps_times: list[float] = []
-        self.fps = 0.0
+        # Decode target reused across frames (allocated by the first retrieve).
+        # Safe because update_face() copies the frame it publishes.
+        self._frame_buf: Optional[np.ndarray] = None
+        self.use_opencl = False
 
         # Camera connection tracking
         self.consecutive_failures = 0
@@ -99,6 +101,33 @@ class VisionThread(threading.Thread):
 
         return frame[top:bottom, left:right]
 
+    def _dark_check_gray(self, frame: np.ndarray) -> np.ndarray:
+        """Return a subsampled grayscale image for the brightness statistics.
+
+        Nearest-neighbour subsampling keeps the pixel distribution intact, so
+        the percentile and std deviation match the full frame closely while
+        touching a fraction of the pixels.
+        """
+        src = cv2.UMat(frame) if self.use_opencl else frame
+        if self.DARK_CHECK_SCALE != 1.0:
+            src = cv2.resize(src, None, fx=self.DARK_CHECK_SCALE, fy=self.DARK_CHECK_SCALE,
+                             interpolation=cv2.INTER_NEAREST)
+        if len(frame.shape) == 3:
+            src = cv2.cvtColor(src, cv2.COLOR_BGR2GRAY)
+        return src.get() if self.use_opencl else src
+
+    def _handle_capture_failure(self) -> None:
+        """Track consecutive capture failures and report camera disconnect."""
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.MAX_CONSECUTIVE_FAILURES:
+            if self.camera_connected:
+                logger.error("Camera disconnected (too many consecutive failures)")
+                self.state.add_error("Camera disconnected")
+            self.camera_connected = False
+            self.state.set_camera_connected(False)
+        logger.warning("Failed to capture frame")
+        time.sleep(0.01)
+
     def run(self) -> None:
         """Main vision loop - identical structure to vision_servo_test.py"""
         logger.info("Vision thread starting...")
@@ -112,6 +141,13 @@ class VisionThread(threading.Thread):
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.CAMERA_HEIGHT)
         self.cap.set(cv2.CAP_PROP_FPS, config.CAMERA_FPS)
 
+        # Request compressed frames (cheap grab) and a shallow driver queue
+        # so we always work on the freshest frame instead of a stale backlog
+        fourcc = getattr(config, 'CAMERA_FOURCC', None)
+        if fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, getattr(config, 'CAMERA_BUFFER_SIZE', 1))
+
         # Apply exposure settings
         auto_exposure = getattr(config, 'CAMERA_AUTO_EXPOSURE', True)
         if not auto_exposure:
@@ -143,29 +179,50 @@ class VisionThread(threading.Thread):
         actual_h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         logger.info(f"Camera opened: {actual_w}x{actual_h}")
 
+        # Route dark-check preprocessing through OpenCL (UMat) when requested
+        # and available. OpenCV's process-wide setting is left alone otherwise.
+        self.use_opencl = getattr(config, 'USE_OPENCL', False) and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        logger.info(f"OpenCL preprocessing {'enabled' if self.use_opencl else 'disabled'}")
+
         # Initialize face tracker (same as vision_servo_test.py)
         logger.info("Initializing face tracker...")
         self.tracker = FaceTracker()
 
         logger.info("Vision thread running")
 
+        # Frames arriving faster than this are grabbed (to drain the driver
+        # queue) but never decoded or processed. The gate tolerates half a
+        # camera period of arrival jitter, and is off entirely when the limit
+        # is not below the camera rate.
+        process_fps = getattr(config, 'VISION_PROCESS_FPS', config.CAMERA_FPS)
+        if process_fps >= config.CAMERA_FPS:
+            process_interval = 0.0
+        else:
+            process_interval = 1.0 / process_fps - 0.5 / config.CAMERA_FPS
+        last_process_time = 0.0
+        _time = time.monotonic
+
         # Main loop - same structure as vision_servo_test.py
         while not self.stop_event.is_set():
-            frame_start = time.time()
+            # Grab every frame, but only decode (retrieve) when we will process it
+            if not self.cap.grab():
+                self._handle_capture_failure()
+                continue
+
+            # One clock read per iteration, taken once the frame has arrived:
+            # gates processing and stamps the detection
+            frame_start = _time()
+            if frame_start - last_process_time < process_interval:
+                continue
 
-            # Capture frame (same as vision_servo_test.py)
-            ret, frame = self.cap.read()
+            ret, frame = self.cap.retrieve(self._frame_buf)
             if not ret:
-                self.consecutive_failures += 1
-                if self.consecutive_failures >= self.MAX_CONSECUTIVE_FAILURES:
-                    if self.camera_connected:
-                        logger.error("Camera disconnected (too many consecutive failures)")
-                        self.state.add_error("Camera disconnected")
-                    self.camera_connected = False
-                    self.state.set_camera_connected(False)
-                logger.warning("Failed to capture frame")
-                time.sleep(0.01)
+                self._handle_capture_failure()
                 continue
+            self._frame_buf = frame
+            last_process_time = frame_start
 
             # Successful frame read - reset failure counter
             self.consecutive_failures = 0
@@ -181,11 +238,7 @@ class VisionThread(threading.Thread):
 
             # Check if frame is too dark (door closed) - skip CV to save CPU
             # Use percentile-based detection to be robust to small bright LED spots
-            # Convert to grayscale for brightness calculation
-            if len(frame.shape) == 3:
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = frame
+            gray = self._dark_check_gray(frame)
 
             # Use percentile instead of mean - more robust to LED hotspots
             # e.g., 75th percentile means 75% of pixels must be below threshold
@@ -213,31 +266,25 @@ class VisionThread(threading.Thread):
                     frame_brightness=frame_brightness,
                     frame_variance=frame_variance,
                     camera_connected=True,
+                    timestamp=frame_start,
                 )
             else:
                 # Process frame with face tracker (same as vision_servo_test.py)
                 result = self.tracker.process(frame)
 
                 # Update state with face detection results
-                if result["detected"] and result["bbox"]:
-                    x, y, w, h = result["bbox"]
-
-                    # Get multi-face info if available
-                    all_faces = result.get("all_faces", [])
-                    num_faces = len(all_faces) if all_faces else 1
-                    num_facing = sum(1 for f in all_faces if f.get("is_facing", False)) if all_faces else (1 if result.get("is_facing") else 0)
-
+                if result.detected and result.bbox:
                     self.state.update_face(
                         detected=True,
-                        bbox=result["bbox"],
-                        landmarks=result["landmarks"],
-                        yaw=result["yaw"],
-                        pitch=result["pitch"],
-                        roll=result["roll"],
-                        is_facing=result["is_facing"],
-                        confidence=result["confidence"],
-                        num_faces=num_faces,
-                        num_facing=num_facing,
+                        bbox=result.bbox,
+                        landmarks=result.landmarks,
+                        yaw=result.yaw,
+                        pitch=result.pitch,
+                        roll=result.roll,
+                        is_facing=result.is_facing,
+                        confidence=result.confidence,
+                        num_faces=result.num_faces,
+                        num_facing=result.num_facing,
                         frame_width=frame_w,
                         frame_height=frame_h,
                         processed_frame=frame,
@@ -245,6 +292,7 @@ class VisionThread(threading.Thread):
                         frame_brightness=frame_brightness,
                         frame_variance=frame_variance,
                         camera_connected=True,
+                        timestamp=frame_start,
                     )
                 else:
                     self.state.update_face(
@@ -256,16 +304,9 @@ class VisionThread(threading.Thread):
                         frame_brightness=frame_brightness,
                         frame_variance=frame_variance,
                         camera_connected=True,
+                        timestamp=frame_start,
                     )
 
-            # Update FPS (same as vision_servo_test.py)
-            now = time.time()
-            self.fps_times.append(now)
-            self.fps_times = [t for t in self.fps_times if t > now - 1.0]
-            if len(self.fps_times) > 1:
-                self.fps = len(self.fps_times) / (self.fps_times[-1] - self.fps_times[0])
-                self.state.update_fps(self.fps, self.fps)
-
         # Cleanup
         self.cap.release()
         logger.info("Vision thread stopped")
@@ -291,50 +332,36 @@ class StateMachineThread(threading.Thread):
         logger.info("State machine thread starting...")
 
         tick_interval = 1.0 / self.tick_rate
-        last_tick = time.time()
-
-        while not self.stop_event.is_set():
-            now = time.time()
-            if now - last_tick >= tick_interval:
-                last_tick = now
+        next_tick = time.monotonic()
 
-                # Get current face and ESP state
-                face_state = self.state.get_face()
-                esp_state = self.state.get_esp()
+        # Sleep until the next tick is due; stop_event unblocks shutdown immediately
+        while not self.stop_event.wait(max(0.0, next_tick - time.monotonic())):
+            next_tick += tick_interval
+            # If we fell more than a tick behind, resync rather than burst
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick = now + tick_interval
 
-                # Run state machine tick
-                commands = self.state_machine.tick(face_state, esp_state)
+            # Get current face and ESP state
+            face_state = self.state.get_face()
+            esp_state = self.state.get_esp()
 
-                # Apply commands to state
-                self._apply_commands(commands)
+            # Run state machine tick
+            commands = self.state_machine.tick(face_state, esp_state, now)
 
-            # Small sleep to prevent busy-waiting
-            time.sleep(0.001)
+            # Apply commands to state
+            self._apply_commands(commands)
 
         logger.info("State machine thread stopped")
 
     def _apply_commands(self, commands: dict) -> None:
-        """Apply state machine commands to the app state."""
-        self.state.set_command(
-            servo_target_1=commands.get("servo_target_1", 90.0),
-            servo_target_2=commands.get("servo_target_2", 90.0),
-            valve_open=commands.get("valve_open", False),
-            rgb_mode=commands.get("rgb_mode", 0),
-            rgb_r=commands.get("rgb_r", 0),
-            rgb_g=commands.get("rgb_g", 0),
-            rgb_b=commands.get("rgb_b", 0),
-            npm_mode=commands.get("npm_mode", 0),
-            npm_letter=commands.get("npm_letter", "A"),
-            npm_r=commands.get("npm_r", 255),
-            npm_g=commands.get("npm_g", 255),
-            npm_b=commands.get("npm_b", 255),
-            npr_mode=commands.get("npr_mode", 0),
-            npr_r=commands.get("npr_r", 255),
-            npr_g=commands.get("npr_g", 255),
-            npr_b=commands.get("npr_b", 255),
-            matrix_left=commands.get("matrix_left", 1),
-            matrix_right=commands.get("matrix_right", 2),
-        )
+        """Apply state machine commands to the app state.
+
+        The state machine builds every command through _make_commands(), whose
+        keys match set_command()'s keyword arguments, so the dict is passed
+        straight through in a single locked update.
+        """
+        self.state.set_command(**commands)
 
     def get_state_machine(self) -> StateMachine:
         """Get the state machine instance for external control."""
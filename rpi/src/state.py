@@ -1,37 +1,62 @@
-"""Thread-safe centralized state management."""
+"""Thread-safe centralized state management.
+
+Frame, face, ESP and command state are immutable snapshots published by
+swapping a single attribute. Readers just load the current reference, with
+no lock and no copy. Writers of each section serialize on that section's
+own lock, which only guards read-modify-write updates such as command
+flags. No method holds more than one lock at a time, so there is no lock
+ordering to get wrong. SystemState stays mutable: its counters are bumped
+in place by their single writer thread, and get_system() returns a copy.
+
+get_all() returns a composite of independent per-section snapshots. The
+dashboard tolerates that. The face snapshot carries the processed frame
+it was computed on, so those two always match.
+
+All timestamps use time.monotonic(), so NTP steps cannot fake a timeout.
+Producers read the clock once per loop iteration and pass it in. The one
+exception is error timestamps, which are wall-clock for display.
+"""
 
 from __future__ import annotations
 
 import threading
 import time
-from dataclasses import dataclass, field
-from typing import Optional
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Any, NamedTuple, Optional
 
 import numpy as np
 
+import config
+
+# Seconds without a status packet before the ESP32 counts as disconnected
+ESP_CONNECTION_TIMEOUT_S = config.UART_CONNECTION_TIMEOUT_MS / 1000.0
 
-@dataclass
-class FrameData:
-    """Raw camera frame data."""
+
+class FrameData(NamedTuple):
+    """Raw camera frame data (immutable; replaced wholesale on each update)."""
 
     raw_frame: Optional[np.ndarray] = None
     frame_id: int = 0
     timestamp: float = 0.0
 
-    def update(self, frame: np.ndarray, frame_id: int) -> None:
-        """Update frame data."""
-        self.raw_frame = frame
-        self.frame_id = frame_id
-        self.timestamp = time.time()
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FaceState:
-    """Face detection and pose estimation results."""
+    """Face detection and pose estimation results.
+
+    Immutable: AppState publishes a new instance on every update, so readers
+    can hold on to the one they got without copying.
+
+    ``landmarks`` is shared, not copied, between the tracker, the state
+    container and every reader. AppState.update_face() marks it read-only
+    when it is published, so any stray in-place write raises instead of
+    corrupting other readers. Copy it first if you need to modify it.
+    """
 
     detected: bool = False
     bbox: Optional[tuple[int, int, int, int]] = None  # x, y, w, h
-    landmarks: Optional[np.ndarray] = None  # 468 points (x, y, z)
+    landmarks: Optional[np.ndarray] = None  # (N, 3) float32 pixel coords (x, y, z)
     yaw: float = 0.0  # Horizontal rotation (left/right)
     pitch: float = 0.0  # Vertical rotation (up/down)
     roll: float = 0.0  # Tilt rotation
@@ -53,26 +78,30 @@ class FaceState:
     # Camera connection status
     camera_connected: bool = False  # True when camera is working properly
 
-    def clear(self) -> None:
-        """Clear face detection results."""
-        self.detected = False
-        self.bbox = None
-        self.landmarks = None
-        self.yaw = 0.0
-        self.pitch = 0.0
-        self.roll = 0.0
-        self.is_facing = False
-        self.confidence = 0.0
-        self.num_faces = 0
-        self.num_facing = 0
-        # Note: processed_frame and frame dimensions are NOT cleared
-
-
-@dataclass
+    def cleared(self) -> FaceState:
+        """Return a copy with face detection results cleared.
+
+        processed_frame and frame dimensions are kept.
+        """
+        return replace(
+            self,
+            detected=False,
+            bbox=None,
+            landmarks=None,
+            yaw=0.0,
+            pitch=0.0,
+            roll=0.0,
+            is_facing=False,
+            confidence=0.0,
+            num_faces=0,
+            num_facing=0,
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class EspState:
-    """State received from ESP32."""
+    """State received from ESP32 (immutable, replaced on each packet)."""
 
-    connected: bool = False
     limit_triggered: bool = False
     limit_direction: int = 0  # 0=none, 1=CW, 2=CCW
     servo_positions: tuple[float, float, float] = (90.0, 90.0, 90.0)  # 3 servos
@@ -82,10 +111,11 @@ class EspState:
     valve_open: bool = False  # True when valve is currently open
     valve_enabled: bool = True  # False when emergency stop active
     valve_ms: int = 0  # How long valve has been open (ms)
-    last_rx_time: float = 0.0
+    last_rx_time: float = 0.0  # time.monotonic() of last packet
 
-    def update_from_packet(
-        self,
+    @classmethod
+    def from_packet(
+        cls,
         limit: int,
         servo_positions: tuple[float, float, float],
         light_state: int,
@@ -94,29 +124,38 @@ class EspState:
         valve_open: int = 0,
         valve_enabled: int = 1,
         valve_ms: int = 0,
-    ) -> None:
-        """Update state from received packet."""
-        self.connected = True
-        self.limit_triggered = limit != 0
-        self.limit_direction = limit
-        self.servo_positions = servo_positions
-        self.light_state = light_state == 1
-        self.flags = flags
-        self.test_active = test_active == 1
-        self.valve_open = valve_open == 1
-        self.valve_enabled = valve_enabled == 1
-        self.valve_ms = valve_ms
-        self.last_rx_time = time.time()
-
-    def check_connection(self, timeout_ms: float) -> None:
-        """Check if connection is still active."""
-        if time.time() - self.last_rx_time > timeout_ms / 1000.0:
-            self.connected = False
-
-
-@dataclass
+        timestamp: float = 0.0,
+    ) -> EspState:
+        """Build state from a received packet (timestamp 0 = now)."""
+        return cls(
+            limit_triggered=limit != 0,
+            limit_direction=limit,
+            servo_positions=servo_positions,
+            light_state=light_state == 1,
+            flags=flags,
+            test_active=test_active == 1,
+            valve_open=valve_open == 1,
+            valve_enabled=valve_enabled == 1,
+            valve_ms=valve_ms,
+            last_rx_time=timestamp or time.monotonic(),
+        )
+
+    @property
+    def connected(self) -> bool:
+        """True if a status packet arrived within the connection timeout.
+
+        Evaluated on access, so even a held snapshot goes stale on its own
+        and nobody has to poll for timeouts.
+        """
+        return (
+            self.last_rx_time > 0
+            and time.monotonic() - self.last_rx_time <= ESP_CONNECTION_TIMEOUT_S
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class CommandState:
-    """Commands to send to ESP32."""
+    """Commands to send to ESP32 (immutable, replaced on each change)."""
 
     servo_targets: tuple[float, float, float] = (90.0, 90.0, 90.0)  # 3 servos
     light_command: int = 2  # Default to AUTO
@@ -144,7 +183,7 @@ class CommandState:
     valve_open: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemState:
     """System-level state."""
 
@@ -153,20 +192,34 @@ class SystemState:
     uart_tx_count: int = 0
     uart_rx_count: int = 0
     uptime: float = 0.0
-    start_time: float = field(default_factory=time.time)
-    errors: list[str] = field(default_factory=list)
+    start_time: float = field(default_factory=time.monotonic)
+    errors: deque[tuple[float, str]] = field(default_factory=lambda: deque(maxlen=10))  # (time, message)
     last_tx_packet: str = ""  # Last command sent to ESP32
     last_rx_packet: str = ""  # Last status received from ESP32
 
     def add_error(self, error: str) -> None:
-        """Add error to list, keeping last 10."""
-        self.errors.append(f"{time.strftime('%H:%M:%S')} - {error}")
-        if len(self.errors) > 10:
-            self.errors.pop(0)
+        """Add error, keeping last 10 (deque evicts the oldest)."""
+        self.errors.append((time.time(), error))
+
+    def formatted_errors(self) -> list[str]:
+        """Errors as display strings ("HH:MM:SS - message"), formatted on demand."""
+        return [
+            f"{time.strftime('%H:%M:%S', time.localtime(ts))} - {error}"
+            for ts, error in self.errors
+        ]
 
     def update_uptime(self) -> None:
         """Update uptime value."""
-        self.uptime = time.time() - self.start_time
+        self.uptime = time.monotonic() - self.start_time
+
+
+def _packet_text(packet: Any) -> str:
+    """Render a stored UART packet (bytes, str or parsed packet) for display."""
+    if packet is None:
+        return ""
+    if isinstance(packet, (bytes, bytearray)):
+        return packet.decode("ascii", errors="replace").strip()
+    return str(packet).strip()
 
 
 class AppState:
@@ -177,37 +230,48 @@ class AppState:
     """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
+        self._face_lock = threading.Lock()
+        self._esp_lock = threading.Lock()
+        self._cmd_lock = threading.Lock()
+        self._sys_lock = threading.Lock()
         self._frame = FrameData()
         self._face = FaceState()
         self._esp = EspState()
         self._command = CommandState()
         self._system = SystemState()
 
-    @property
-    def lock(self) -> threading.Lock:
-        """Get the state lock for external synchronization."""
-        return self._lock
+        # Vision frame counter (bumped by update_face); FPS is derived from it
+        # on the read side so the vision loop never computes it
+        self._frame_count = 0
+        self._fps_sample_time = time.monotonic()
+        self._fps_sample_count = 0
+
+        # Last packets as handed over by the UART thread; only stringified
+        # when someone actually reads system state
+        self._last_tx_raw: Any = None
+        self._last_rx_raw: Any = None
 
     # -------------------------------------------------------------------------
     # Frame Data Access
     # -------------------------------------------------------------------------
 
-    def update_frame(self, frame: np.ndarray, frame_id: int) -> None:
-        """Thread-safe frame update."""
-        with self._lock:
-            self._frame.update(frame, frame_id)
-
-    def get_frame(self) -> tuple[Optional[np.ndarray], int, float]:
-        """Thread-safe frame retrieval. Returns (frame, frame_id, timestamp)."""
-        with self._lock:
-            if self._frame.raw_frame is not None:
-                return (
-                    self._frame.raw_frame.copy(),
-                    self._frame.frame_id,
-                    self._frame.timestamp,
-                )
-            return None, 0, 0.0
+    def update_frame(self, frame: np.ndarray, frame_id: int, timestamp: float = 0.0) -> None:
+        """Thread-safe frame update.
+
+        Takes ownership of ``frame``: the caller must not write to it again.
+        ``timestamp`` is the caller's time.monotonic() reading; 0 means now.
+        """
+        frame.flags.writeable = False
+        # Single producer: one attribute rebind publishes all three fields
+        # atomically, so neither side needs a lock
+        self._frame = FrameData(frame, frame_id, timestamp or time.monotonic())
+
+    def get_frame(self) -> FrameData:
+        """Thread-safe frame retrieval. Returns (frame, frame_id, timestamp).
+
+        The frame is shared and read-only; copy it before modifying.
+        """
+        return self._frame
 
     # -------------------------------------------------------------------------
     # Face State Access
@@ -232,64 +296,63 @@ class AppState:
         frame_brightness: float = 0.0,
         frame_variance: float = 0.0,
         camera_connected: bool = True,
+        timestamp: float = 0.0,
     ) -> None:
-        """Thread-safe face state update."""
-        with self._lock:
-            self._face.detected = detected
-            self._face.bbox = bbox
-            self._face.landmarks = landmarks.copy() if landmarks is not None else None
-            self._face.yaw = yaw
-            self._face.pitch = pitch
-            self._face.roll = roll
-            self._face.is_facing = is_facing
-            self._face.confidence = confidence
-            self._face.num_faces = num_faces
-            self._face.num_facing = num_facing
-            self._face.frame_width = frame_width
-            self._face.frame_height = frame_height
-            self._face.is_dark = is_dark
-            self._face.frame_brightness = frame_brightness
-            self._face.frame_variance = frame_variance
-            self._face.camera_connected = camera_connected
-            self._face.timestamp = time.time()
-            # Store the frame this detection was made on (for synchronized display)
-            if processed_frame is not None:
-                self._face.processed_frame = processed_frame.copy()
+        """Thread-safe face state update.
 
-    def get_face(self) -> FaceState:
-        """Thread-safe face state retrieval (returns copy)."""
-        with self._lock:
-            return FaceState(
-                detected=self._face.detected,
-                bbox=self._face.bbox,
-                landmarks=self._face.landmarks.copy()
-                if self._face.landmarks is not None
-                else None,
-                yaw=self._face.yaw,
-                pitch=self._face.pitch,
-                roll=self._face.roll,
-                is_facing=self._face.is_facing,
-                confidence=self._face.confidence,
-                timestamp=self._face.timestamp,
-                num_faces=self._face.num_faces,
-                num_facing=self._face.num_facing,
-                frame_width=self._face.frame_width,
-                frame_height=self._face.frame_height,
-                is_dark=self._face.is_dark,
-                frame_brightness=self._face.frame_brightness,
-                frame_variance=self._face.frame_variance,
-                camera_connected=self._face.camera_connected,
+        ``timestamp`` is the caller's time.monotonic() capture time; 0 means now.
+        """
+        if not timestamp:
+            timestamp = time.monotonic()
+        # Landmarks are shared by reference: freeze them so no reader (or the
+        # producer) can modify a published array in place
+        if landmarks is not None:
+            landmarks.setflags(write=False)
+        # The producer reuses its capture buffer, so take one private copy
+        # (outside the lock) and share it read-only with every reader
+        frame_copy = None
+        if processed_frame is not None:
+            frame_copy = processed_frame.copy()
+            frame_copy.flags.writeable = False
+        with self._face_lock:
+            if frame_copy is None:
+                frame_copy = self._face.processed_frame
+            self._face = FaceState(
+                detected=detected,
+                bbox=bbox,
+                landmarks=landmarks,
+                yaw=yaw,
+                pitch=pitch,
+                roll=roll,
+                is_facing=is_facing,
+                confidence=confidence,
+                timestamp=timestamp,
+                num_faces=num_faces,
+                num_facing=num_facing,
+                frame_width=frame_width,
+                frame_height=frame_height,
+                processed_frame=frame_copy,
+                is_dark=is_dark,
+                frame_brightness=frame_brightness,
+                frame_variance=frame_variance,
+                camera_connected=camera_connected,
             )
+            self._frame_count += 1
+
+    def get_face(self) -> FaceState:
+        """Thread-safe face state retrieval (immutable, no copy needed)."""
+        return self._face
 
     def clear_face(self) -> None:
         """Thread-safe clear face detection."""
-        with self._lock:
-            self._face.clear()
+        with self._face_lock:
+            self._face = self._face.cleared()
 
     def set_camera_connected(self, connected: bool) -> None:
         """Thread-safe update of camera connection status."""
-        with self._lock:
-            self._face.camera_connected = connected
+        with self._face_lock:
+            if self._face.camera_connected != connected:
+                self._face = replace(self._face, camera_connected=connected)
 
     # -------------------------------------------------------------------------
     # ESP State Access
@@ -305,35 +368,19 @@ class AppState:
         valve_open: int = 0,
         valve_enabled: int = 1,
         valve_ms: int = 0,
+        timestamp: float = 0.0,
     ) -> None:
         """Thread-safe ESP state update from received packet."""
-        with self._lock:
-            self._esp.update_from_packet(
-                limit, servo_positions, light_state, flags,
-                test_active, valve_open, valve_enabled, valve_ms
-            )
+        esp = EspState.from_packet(
+            limit, servo_positions, light_state, flags,
+            test_active, valve_open, valve_enabled, valve_ms, timestamp
+        )
+        with self._esp_lock:
+            self._esp = esp
 
     def get_esp(self) -> EspState:
-        """Thread-safe ESP state retrieval (returns copy)."""
-        with self._lock:
-            return EspState(
-                connected=self._esp.connected,
-                limit_triggered=self._esp.limit_triggered,
-                limit_direction=self._esp.limit_direction,
-                servo_positions=self._esp.servo_positions,
-                light_state=self._esp.light_state,
-                flags=self._esp.flags,
-                test_active=self._esp.test_active,
-                valve_open=self._esp.valve_open,
-                valve_enabled=self._esp.valve_enabled,
-                valve_ms=self._esp.valve_ms,
-                last_rx_time=self._esp.last_rx_time,
-            )
-
-    def check_esp_connection(self, timeout_ms: float) -> None:
-        """Thread-safe ESP connection check."""
-        with self._lock:
-            self._esp.check_connection(timeout_ms)
+        """Thread-safe ESP state retrieval (immutable, no copy needed)."""
+        return self._esp
 
     # -------------------------------------------------------------------------
     # Command State Access
@@ -364,132 +411,119 @@ class AppState:
         npr_b: Optional[int] = None,
         valve_open: Optional[bool] = None,
     ) -> None:
-        """Thread-safe command update."""
-        with self._lock:
+        """Thread-safe command update (publishes a new CommandState)."""
+        changes = {
+            name: value
+            for name, value in (
+                ("light_command", light_command),
+                ("flags", flags),
+                ("rgb_mode", rgb_mode),
+                ("rgb_r", rgb_r),
+                ("rgb_g", rgb_g),
+                ("rgb_b", rgb_b),
+                ("matrix_left", matrix_left),
+                ("matrix_right", matrix_right),
+                ("npm_mode", npm_mode),
+                ("npm_letter", npm_letter),
+                ("npm_r", npm_r),
+                ("npm_g", npm_g),
+                ("npm_b", npm_b),
+                ("npr_mode", npr_mode),
+                ("npr_r", npr_r),
+                ("npr_g", npr_g),
+                ("npr_b", npr_b),
+                ("valve_open", valve_open),
+            )
+            if value is not None
+        }
+        with self._cmd_lock:
+            if servo_targets is None and (
+                servo_target_1 is not None
+                or servo_target_2 is not None
+                or servo_target_3 is not None
+            ):
+                # Allow individual servo updates; build the new tuple directly
+                t1, t2, t3 = self._command.servo_targets
+                servo_targets = (
+                    t1 if servo_target_1 is None else servo_target_1,
+                    t2 if servo_target_2 is None else servo_target_2,
+                    t3 if servo_target_3 is None else servo_target_3,
+                )
             if servo_targets is not None:
-                self._command.servo_targets = servo_targets
-            else:
-                # Allow individual servo updates
-                targets = list(self._command.servo_targets)
-                if servo_target_1 is not None:
-                    targets[0] = servo_target_1
-                if servo_target_2 is not None:
-                    targets[1] = servo_target_2
-                if servo_target_3 is not None:
-                    targets[2] = servo_target_3
-                self._command.servo_targets = tuple(targets)
-            if light_command is not None:
-                self._command.light_command = light_command
-            if flags is not None:
-                self._command.flags = flags
-            if rgb_mode is not None:
-                self._command.rgb_mode = rgb_mode
-            if rgb_r is not None:
-                self._command.rgb_r = rgb_r
-            if rgb_g is not None:
-                self._command.rgb_g = rgb_g
-            if rgb_b is not None:
-                self._command.rgb_b = rgb_b
-            if matrix_left is not None:
-                self._command.matrix_left = matrix_left
-            if matrix_right is not None:
-                self._command.matrix_right = matrix_right
-            if npm_mode is not None:
-                self._command.npm_mode = npm_mode
-            if npm_letter is not None:
-                self._command.npm_letter = npm_letter
-            if npm_r is not None:
-                self._command.npm_r = npm_r
-            if npm_g is not None:
-                self._command.npm_g = npm_g
-            if npm_b is not None:
-                self._command.npm_b = npm_b
-            if npr_mode is not None:
-                self._command.npr_mode = npr_mode
-            if npr_r is not None:
-                self._command.npr_r = npr_r
-            if npr_g is not None:
-                self._command.npr_g = npr_g
-            if npr_b is not None:
-                self._command.npr_b = npr_b
-            if valve_open is not None:
-                self._command.valve_open = valve_open
+                changes["servo_targets"] = servo_targets
+            self._command = replace(self._command, **changes)
 
     def get_command(self) -> CommandState:
-        """Thread-safe command retrieval (returns copy)."""
-        with self._lock:
-            return CommandState(
-                servo_targets=self._command.servo_targets,
-                light_command=self._command.light_command,
-                flags=self._command.flags,
-                rgb_mode=self._command.rgb_mode,
-                rgb_r=self._command.rgb_r,
-                rgb_g=self._command.rgb_g,
-                rgb_b=self._command.rgb_b,
-                matrix_left=self._command.matrix_left,
-                matrix_right=self._command.matrix_right,
-                npm_mode=self._command.npm_mode,
-                npm_letter=self._command.npm_letter,
-                npm_r=self._command.npm_r,
-                npm_g=self._command.npm_g,
-                npm_b=self._command.npm_b,
-                npr_mode=self._command.npr_mode,
-                npr_r=self._command.npr_r,
-                npr_g=self._command.npr_g,
-                npr_b=self._command.npr_b,
-                valve_open=self._command.valve_open,
-            )
+        """Thread-safe command retrieval (immutable, no copy needed)."""
+        return self._command
 
     def set_command_flag(self, flag: int) -> None:
         """Thread-safe set a command flag bit."""
-        with self._lock:
-            self._command.flags |= flag
+        with self._cmd_lock:
+            self._command = replace(self._command, flags=self._command.flags | flag)
 
     def clear_command_flag(self, flag: int) -> None:
         """Thread-safe clear a command flag bit."""
-        with self._lock:
-            self._command.flags &= ~flag
+        with self._cmd_lock:
+            self._command = replace(self._command, flags=self._command.flags & ~flag)
 
     def trigger_led_test(self) -> None:
         """Trigger the LED blink test on ESP32."""
-        import config
         self.set_command_flag(config.CMD_FLAG_LED_TEST)
 
     # -------------------------------------------------------------------------
     # System State Access
     # -------------------------------------------------------------------------
 
-    def update_fps(self, fps: float, face_tracker_fps: float = 0.0) -> None:
-        """Thread-safe FPS update."""
-        with self._lock:
+    # UART counters have exactly one writer (the UART thread), and every
+    # store is a single attribute assignment that is atomic under the GIL,
+    # so these updates skip the lock. Readers may see the fields a packet
+    # apart, which is fine for telemetry.
+
+    def _refresh_fps(self, now: float) -> None:
+        """Recompute vision FPS from the frame counter (call with _sys_lock held).
+
+        Only updates once at least a second has passed since the last sample,
+        so frequent readers see a stable 1-second average.
+        """
+        elapsed = now - self._fps_sample_time
+        if elapsed >= 1.0:
+            fps = (self._frame_count - self._fps_sample_count) / elapsed
             self._system.fps = fps
-            if face_tracker_fps > 0:
-                self._system.face_tracker_fps = face_tracker_fps
-            self._system.update_uptime()
+            self._system.face_tracker_fps = fps
+            self._fps_sample_time = now
+            self._fps_sample_count = self._frame_count
+
+    def increment_uart_tx(self, packet: Any = None) -> None:
+        """UART TX counter increment (UART thread only).
 
-    def increment_uart_tx(self, packet: str = "") -> None:
-        """Thread-safe UART TX counter increment."""
-        with self._lock:
-            self._system.uart_tx_count += 1
-            if packet:
-                self._system.last_tx_packet = packet.strip()
+        ``packet`` is stored as-is (encoded bytes or str) and only decoded
+        for display in get_system().
+        """
+        self._system.uart_tx_count += 1
+        if packet:
+            self._last_tx_raw = packet
 
-    def increment_uart_rx(self, packet: str = "") -> None:
-        """Thread-safe UART RX counter increment."""
-        with self._lock:
-            self._system.uart_rx_count += 1
-            if packet:
-                self._system.last_rx_packet = packet.strip()
+    def increment_uart_rx(self, packet: Any = None, count: int = 1) -> None:
+        """UART RX counter increment (UART thread only).
+
+        ``packet`` may be a parsed StatusPacket or a str; it is formatted
+        via str() only when read in get_system(). ``count`` lets a batch of
+        packets be recorded in one call, with ``packet`` the newest.
+        """
+        self._system.uart_rx_count += count
+        if packet:
+            self._last_rx_raw = packet
 
     def add_error(self, error: str) -> None:
-        """Thread-safe error logging."""
-        with self._lock:
-            self._system.add_error(error)
+        """Thread-safe error logging (deque.append is atomic, no lock needed)."""
+        self._system.add_error(error)
 
     def get_system(self) -> SystemState:
         """Thread-safe system state retrieval (returns copy)."""
-        with self._lock:
+        with self._sys_lock:
             self._system.update_uptime()
+            self._refresh_fps(time.monotonic())
             return SystemState(
                 fps=self._system.fps,
                 face_tracker_fps=self._system.face_tracker_fps,
@@ -498,8 +532,8 @@ class AppState:
                 uptime=self._system.uptime,
                 start_time=self._system.start_time,
                 errors=self._system.errors.copy(),
-                last_tx_packet=self._system.last_tx_packet,
-                last_rx_packet=self._system.last_rx_packet,
+                last_tx_packet=_packet_text(self._last_tx_raw),
+                last_rx_packet=_packet_text(self._last_rx_raw),
             )
 
     # -------------------------------------------------------------------------
@@ -518,84 +552,16 @@ class AppState:
 
         IMPORTANT: Returns the processed_frame (the frame face detection ran on)
         if available, to ensure frame and face detection are synchronized.
-        Falls back to raw_frame if no processed frame exists yet.
+        Falls back to raw_frame if no processed frame exists yet. The frame is
+        returned without copying and is read-only; copy it before drawing on it.
         """
-        with self._lock:
-            # Prefer processed_frame (synchronized with face detection) over raw_frame
-            if self._face.processed_frame is not None:
-                frame = self._face.processed_frame.copy()
-            elif self._frame.raw_frame is not None:
-                frame = self._frame.raw_frame.copy()
-            else:
-                frame = None
-
-            face = FaceState(
-                detected=self._face.detected,
-                bbox=self._face.bbox,
-                landmarks=self._face.landmarks.copy()
-                if self._face.landmarks is not None
-                else None,
-                yaw=self._face.yaw,
-                pitch=self._face.pitch,
-                roll=self._face.roll,
-                is_facing=self._face.is_facing,
-                confidence=self._face.confidence,
-                timestamp=self._face.timestamp,
-                num_faces=self._face.num_faces,
-                num_facing=self._face.num_facing,
-                is_dark=self._face.is_dark,
-                frame_brightness=self._face.frame_brightness,
-                frame_variance=self._face.frame_variance,
-                camera_connected=self._face.camera_connected,
-            )
-
-            esp = EspState(
-                connected=self._esp.connected,
-                limit_triggered=self._esp.limit_triggered,
-                limit_direction=self._esp.limit_direction,
-                servo_positions=self._esp.servo_positions,
-                light_state=self._esp.light_state,
-                flags=self._esp.flags,
-                test_active=self._esp.test_active,
-                valve_open=self._esp.valve_open,
-                valve_enabled=self._esp.valve_enabled,
-                valve_ms=self._esp.valve_ms,
-                last_rx_time=self._esp.last_rx_time,
-            )
+        # The face snapshot carries the frame it was computed on, so the two
+        # are always in sync without any locking
+        face = self._face
+        frame = face.processed_frame
 
-            command = CommandState(
-                servo_targets=self._command.servo_targets,
-                light_command=self._command.light_command,
-                flags=self._command.flags,
-                rgb_mode=self._command.rgb_mode,
-                rgb_r=self._command.rgb_r,
-                rgb_g=self._command.rgb_g,
-                rgb_b=self._command.rgb_b,
-                matrix_left=self._command.matrix_left,
-                matrix_right=self._command.matrix_right,
-                npm_mode=self._command.npm_mode,
-                npm_letter=self._command.npm_letter,
-                npm_r=self._command.npm_r,
-                npm_g=self._command.npm_g,
-                npm_b=self._command.npm_b,
-                npr_mode=self._command.npr_mode,
-                npr_r=self._command.npr_r,
-                npr_g=self._command.npr_g,
-                npr_b=self._command.npr_b,
-                valve_open=self._command.valve_open,
-            )
-
-            self._system.update_uptime()
-            system = SystemState(
-                fps=self._system.fps,
-                face_tracker_fps=self._system.face_tracker_fps,
-                uart_tx_count=self._system.uart_tx_count,
-                uart_rx_count=self._system.uart_rx_count,
-                uptime=self._system.uptime,
-                start_time=self._system.start_time,
-                errors=self._system.errors.copy(),
-                last_tx_packet=self._system.last_tx_packet,
-                last_rx_packet=self._system.last_rx_packet,
-            )
+        # Fall back to the raw frame before the first detection
+        if frame is None:
+            frame = self._frame.raw_frame
 
-            return frame, face, esp, command, system
+        return frame, face, self._esp, self._command, self.get_system()
@@ -13,10 +13,11 @@ INACTIVE -> (door opens) -> COLLAPSE -> ALIVE or DEAD -> (door closes) -> INACTI
 
 from __future__ import annotations
 
+import math
 import random
 import time
-from dataclasses import dataclass
-from enum import Enum, auto
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
 from typing import Optional
 
 import config
@@ -67,64 +68,81 @@ NPR_SPINNER = 5       # Spinner animation
 RGB_SOLID = 0         # Solid color (use r,g,b values)
 RGB_RAINBOW = 1       # Rainbow cycle (ignore r,g,b)
 
+# Accepted by set_forced_outcome() (None = random)
+_VALID_OUTCOMES = frozenset({"ALIVE", "DEAD", None})
 
-class State(Enum):
-    """State machine states - simplified model."""
-    INACTIVE = auto()   # Door closed, all off
-    COLLAPSE = auto()   # Quantum collapse (2s)
-    ALIVE = auto()      # Cat alive - persistent
-    DEAD = auto()       # Cat dead - persistent
-    FAULT = auto()      # ESP disconnect
 
+class State(IntEnum):
+    """State machine states - simplified model.
 
-class AliveBehavior(Enum):
+    Values (like the behavior enums below) are contiguous from 0 so they can
+    index the StateMachine dispatch tuples directly.
+    """
+    INACTIVE = 0        # Door closed, all off
+    COLLAPSE = 1        # Quantum collapse (2s)
+    ALIVE = 2           # Cat alive - persistent
+    DEAD = 3            # Cat dead - persistent
+    FAULT = 4           # ESP disconnect
+
+
+class AliveBehavior(IntEnum):
     """Sub-behaviors for ALIVE state."""
-    ENTRY = auto()              # Entry animation after collapse (~2s)
-    IDLE = auto()               # No detection - aqua dim, eyes closed
-    DETECTED = auto()           # Face detected - green, tracking, arm static
-    DISPENSING = auto()         # Valve open, aqua flash
-    DISPENSE_REJECT = auto()    # Already dispensed - shake, red flash
+    ENTRY = 0                   # Entry animation after collapse (~2s)
+    IDLE = 1                    # No detection - aqua dim, eyes closed
+    DETECTED = 2                # Face detected - green, tracking, arm static
+    DISPENSING = 3              # Valve open, aqua flash
+    DISPENSE_REJECT = 4         # Already dispensed - shake, red flash
 
 
-class DeadBehavior(Enum):
+class DeadBehavior(IntEnum):
     """Sub-behaviors for DEAD state."""
-    ENTRY = auto()      # Entry animation after collapse (~2s) - red + X
-    NORMAL = auto()     # Static red + X
-    REJECT = auto()     # Limit switch pressed - flash red briefly
+    ENTRY = 0           # Entry animation after collapse (~2s) - red + X
+    NORMAL = 1          # Static red + X
+    REJECT = 2          # Limit switch pressed - flash red briefly
+
+
+def _index_by_value(table: dict) -> tuple:
+    """Turn an {IntEnum member: handler} table into a tuple indexed by value."""
+    return tuple(table[member] for member in type(next(iter(table))))
 
 
-@dataclass
+def _from_config(name: str, default: float):
+    """Dataclass field defaulting to config.<name> (or ``default`` if unset)."""
+    return field(default_factory=lambda: getattr(config, name, default))
+
+
+@dataclass(slots=True)
 class StateMachineConfig:
     """Configuration parameters for the state machine."""
 
     # Tracking parameters - defaults from config.py
-    tracking_velocity_gain: float = None  # How fast base rotates
-    tracking_deadzone: float = None       # Deadzone as fraction of frame
-    tracking_max_velocity: float = None   # Max rotation speed degrees/tick
-    tracking_min_velocity: float = None   # Min rotation speed when outside deadzone
+    tracking_velocity_gain: float = _from_config('TRACKING_VELOCITY_GAIN', 0.1)  # How fast base rotates
+    tracking_deadzone: float = _from_config('TRACKING_DEADZONE', 0.067)  # Deadzone as fraction of frame
+    tracking_max_velocity: float = _from_config('TRACKING_MAX_VELOCITY', 4.0)  # Max rotation speed degrees/tick
+    tracking_min_velocity: float = _from_config('TRACKING_MIN_VELOCITY', 0.5)  # Min rotation speed when outside deadzone
     tracking_invert_direction: bool = False  # Invert tracking direction
     tracking_base_min: float = 0.0   # Minimum base servo angle
     tracking_base_max: float = 180.0  # Maximum base servo angle
-    tracking_min_width_ratio: float = None  # Min face width to track (as fraction of frame)
+    tracking_min_width_ratio: float = _from_config('TRACKING_MIN_WIDTH_RATIO', 0.15)  # Min face width to track (as fraction of frame)
 
     # State durations
-    collapse_duration: float = None       # Duration of collapse animation (2s)
+    collapse_duration: float = _from_config('COLLAPSE_DURATION', 2.0)  # Duration of collapse animation (2s)
     alive_entry_duration: float = 2.0     # Entry animation duration
     dead_entry_duration: float = 2.0      # Entry animation duration
-    dispense_duration: float = None       # How long valve stays open
-    dispense_flash_duration: float = None # How long to flash during dispense
-    reject_flash_duration: float = None   # How long to flash on reject
-    dispense_hold_duration: float = None  # How long to hold switch before dispense
+    dispense_duration: float = _from_config('POUR_DURATION', 3.0)  # How long valve stays open
+    dispense_flash_duration: float = _from_config('DISPENSE_FLASH_DURATION', 2.0)  # How long to flash during dispense
+    reject_flash_duration: float = _from_config('REJECT_FLASH_DURATION', 1.0)  # How long to flash on reject
+    dispense_hold_duration: float = _from_config('DISPENSE_HOLD_DURATION', 1.0)  # How long to hold switch before dispense
 
     # Door detection thresholds
-    dark_to_inactive_duration: float = None  # Seconds of darkness to enter INACTIVE
+    dark_to_inactive_duration: float = _from_config('DARK_TO_INACTIVE_DURATION', 2.0)  # Seconds of darkness to enter INACTIVE
     light_to_collapse_duration: float = 1.0  # Seconds of light to trigger COLLAPSE
 
     # Arm wave parameters
     arm_wave_min: float = 45.0    # Lower for more dramatic wave
     arm_wave_max: float = 135.0   # Higher for more dramatic wave
     arm_wave_speed: float = 4.0   # Degrees per tick (faster wave)
-    arm_wave_interval: float = None  # Seconds between waves when detected
+    arm_wave_interval: float = _from_config('ARM_WAVE_INTERVAL', 5.0)  # Seconds between waves when detected
 
     # Shake parameters (for reject animation)
     shake_speed: float = 15.0   # Degrees per tick
@@ -133,48 +151,40 @@ class StateMachineConfig:
     # Alive/dead probability
     alive_probability: float = 0.5  # 50% chance of alive
 
-    def __post_init__(self):
-        """Load defaults from config.py if not specified."""
-        # Tracking settings
-        if self.tracking_velocity_gain is None:
-            self.tracking_velocity_gain = getattr(config, 'TRACKING_VELOCITY_GAIN', 0.1)
-        if self.tracking_deadzone is None:
-            self.tracking_deadzone = getattr(config, 'TRACKING_DEADZONE', 0.067)
-        if self.tracking_max_velocity is None:
-            self.tracking_max_velocity = getattr(config, 'TRACKING_MAX_VELOCITY', 4.0)
-        if self.tracking_min_velocity is None:
-            self.tracking_min_velocity = getattr(config, 'TRACKING_MIN_VELOCITY', 0.5)
-        if self.tracking_min_width_ratio is None:
-            self.tracking_min_width_ratio = getattr(config, 'TRACKING_MIN_WIDTH_RATIO', 0.15)
-        # State durations
-        if self.collapse_duration is None:
-            self.collapse_duration = getattr(config, 'COLLAPSE_DURATION', 2.0)
-        # Dispense settings
-        if self.dispense_duration is None:
-            self.dispense_duration = getattr(config, 'POUR_DURATION', 3.0)
-        if self.dispense_flash_duration is None:
-            self.dispense_flash_duration = getattr(config, 'DISPENSE_FLASH_DURATION', 2.0)
-        if self.reject_flash_duration is None:
-            self.reject_flash_duration = getattr(config, 'REJECT_FLASH_DURATION', 1.0)
-        if self.dispense_hold_duration is None:
-            self.dispense_hold_duration = getattr(config, 'DISPENSE_HOLD_DURATION', 1.0)
-        # Arm wave interval
-        if self.arm_wave_interval is None:
-            self.arm_wave_interval = getattr(config, 'ARM_WAVE_INTERVAL', 5.0)
-        # Door detection
-        if self.dark_to_inactive_duration is None:
-            self.dark_to_inactive_duration = getattr(config, 'DARK_TO_INACTIVE_DURATION', 2.0)
-
 
 class StateMachine:
     """Main state machine for the dispenser."""
 
+    __slots__ = (
+        "config",
+        "_now", "_flash_on",
+        "_state", "_state_start_time", "_prev_state", "_current_behavior",
+        "tracking_base_position", "_velocity_scale",
+        "arm_wave_position", "_arm_wave_direction", "_last_wave_time", "_wave_active",
+        "_shake_offset", "_shake_direction",
+        "_has_dispensed",
+        "_dispense_start", "_reject_start", "_limit_switch_hold_start",
+        "_outcome", "forced_outcome", "_random",
+        "dispensing_enabled", "_fault_reason",
+        "_skip_requested",
+        "_dark_start_time", "_light_start_time", "_dark_expired",
+        "_manual_valve_open", "_manual_valve_deadline",
+        "_state_dispatch", "_alive_dispatch", "_dead_dispatch",
+        "_cmd_inactive", "_cmd_collapse", "_cmd_dead_normal", "_cmd_dead_reject", "_cmd_fault",
+        "_cmd_alive_green", "_cmd_alive_yellow", "_cmd_alive_idle",
+        "_cmd_alive_dispensing", "_cmd_alive_reject",
+    )
+
     def __init__(self, config: Optional[StateMachineConfig] = None):
         self.config = config or StateMachineConfig()
 
+        # Time sampled once per tick; every tick-path timing uses this
+        self._now: float = time.monotonic()
+        self._flash_on: bool = True
+
         # Current state
         self._state = State.INACTIVE
-        self._state_start_time = time.time()
+        self._state_start_time = self._now
         self._prev_state = State.INACTIVE
 
         # Current behavior (for ALIVE/DEAD states)
@@ -182,6 +192,10 @@ class StateMachine:
 
         # Tracking state
         self.tracking_base_position: float = 90.0
+        # Degrees per tick per unit of centering error, with direction folded in
+        self._velocity_scale: float = -180.0 * self.config.tracking_velocity_gain
+        if self.config.tracking_invert_direction:
+            self._velocity_scale = -self._velocity_scale
 
         # Arm wave state
         self.arm_wave_position: float = 90.0
@@ -204,6 +218,7 @@ class StateMachine:
         # Outcome
         self._outcome: Optional[str] = None  # "ALIVE" or "DEAD"
         self.forced_outcome: Optional[str] = None  # Operator override
+        self._random = random.Random().random  # Private generator for the coin flip
 
         # Safety
         self.dispensing_enabled: bool = True
@@ -215,10 +230,149 @@ class StateMachine:
         # Dark/light tracking for door detection
         self._dark_start_time: float = 0.0   # When darkness started
         self._light_start_time: float = 0.0  # When light started
+        self._dark_expired: bool = False     # Dark long enough to enter INACTIVE
 
         # Manual valve override (for dashboard button)
         self._manual_valve_open: bool = False
-        self._manual_valve_open_time: float = 0.0  # When manual valve was opened
+        self._manual_valve_deadline: float = 0.0  # When manual valve auto-closes
+
+        # Per-state / per-behavior tick handlers
+        self._state_dispatch = _index_by_value({
+            State.INACTIVE: self._tick_inactive,
+            State.COLLAPSE: self._tick_collapse,
+            State.ALIVE: self._tick_alive,
+            State.DEAD: self._tick_dead,
+            State.FAULT: self._tick_fault,
+        })
+        self._alive_dispatch = _index_by_value({
+            AliveBehavior.ENTRY: self._alive_entry,
+            AliveBehavior.IDLE: self._alive_idle,
+            AliveBehavior.DETECTED: self._alive_detected,
+            AliveBehavior.DISPENSING: self._alive_dispensing,
+            AliveBehavior.DISPENSE_REJECT: self._alive_dispense_reject,
+        })
+        self._dead_dispatch = _index_by_value({
+            DeadBehavior.ENTRY: self._dead_normal,  # Same visuals as NORMAL
+            DeadBehavior.NORMAL: self._dead_normal,
+            DeadBehavior.REJECT: self._dead_reject,
+        })
+
+        # Prebuilt outputs (flashing ones keep an off and an on variant, indexed
+        # by flash phase). Fixed states return them as-is; ALIVE outputs copy
+        # them with live servo targets via _with_servos(). Shared, so callers
+        # must not mutate what tick() returns.
+        self._cmd_inactive = self._make_commands(
+            servo_target_1=90.0,
+            servo_target_2=90.0,
+            valve_open=False,
+            rgb_mode=RGB_SOLID,
+            rgb_r=0, rgb_g=0, rgb_b=0,
+            npm_mode=NPM_OFF,
+            npm_r=0, npm_g=0, npm_b=0,
+            npr_mode=NPR_OFF,
+            npr_r=0, npr_g=0, npr_b=0,
+            matrix_left=0,
+            matrix_right=0,
+        )
+        self._cmd_collapse = self._make_commands(
+            servo_target_1=90.0,
+            servo_target_2=90.0,
+            valve_open=False,
+            rgb_mode=RGB_RAINBOW,
+            rgb_r=255, rgb_g=255, rgb_b=255,
+            npm_mode=NPM_RAINBOW,
+            npm_r=255, npm_g=255, npm_b=255,
+            npr_mode=NPR_RAINBOW,
+            npr_r=255, npr_g=255, npr_b=255,
+        )
+        self._cmd_dead_normal = self._make_commands(
+            servo_target_1=90.0,  # No tracking
+            servo_target_2=90.0,
+            valve_open=False,  # Never dispense
+            npm_mode=NPM_X,
+            npm_r=255, npm_g=0, npm_b=0,
+            npr_mode=NPR_SOLID,
+            npr_r=255, npr_g=0, npr_b=0,
+            rgb_mode=RGB_SOLID,
+            rgb_r=200, rgb_g=0, rgb_b=0,
+        )
+        # Indexed by flash phase: [off, on]
+        self._cmd_dead_reject = tuple(
+            self._make_commands(
+                servo_target_1=90.0,
+                servo_target_2=90.0,
+                valve_open=False,
+                npm_mode=NPM_X,
+                npm_r=brightness, npm_g=0, npm_b=0,
+                npr_mode=NPR_SOLID,
+                npr_r=brightness, npr_g=0, npr_b=0,
+                rgb_mode=RGB_SOLID,
+                rgb_r=brightness, rgb_g=0, rgb_b=0,
+            )
+            for brightness in (0, 255)
+        )
+        self._cmd_alive_green = self._make_commands(
+            npm_mode=NPM_EYE_OPEN,
+            npm_r=0, npm_g=255, npm_b=0,  # Green
+            npr_mode=NPR_SOLID,
+            npr_r=0, npr_g=255, npr_b=0,
+            rgb_mode=RGB_SOLID,
+            rgb_r=0, rgb_g=200, rgb_b=0,
+        )
+        self._cmd_alive_yellow = self._make_commands(
+            npm_mode=NPM_EYE_OPEN,
+            npm_r=180, npm_g=255, npm_b=0,  # Yellow-green
+            npr_mode=NPR_SOLID,
+            npr_r=180, npr_g=255, npr_b=0,
+            rgb_mode=RGB_SOLID,
+            rgb_r=150, rgb_g=200, rgb_b=0,
+        )
+        self._cmd_alive_idle = self._make_commands(
+            npm_mode=NPM_EYE_CLOSED,
+            npm_r=0, npm_g=180, npm_b=180,  # Aqua
+            npr_mode=NPR_BREATHE,
+            npr_r=0, npr_g=150, npr_b=150,
+            rgb_mode=RGB_SOLID,
+            rgb_r=0, rgb_g=80, rgb_b=80,  # Dim aqua
+        )
+        self._cmd_alive_dispensing = tuple(
+            self._make_commands(
+                npm_mode=NPM_EYE_OPEN,  # Open eyes = dispensing (not X)
+                npm_r=0, npm_g=brightness, npm_b=brightness,  # Aqua flash
+                npr_mode=NPR_SOLID,
+                npr_r=0, npr_g=brightness, npr_b=brightness,
+                rgb_mode=RGB_SOLID,
+                rgb_r=0, rgb_g=brightness, rgb_b=brightness,
+            )
+            for brightness in (0, 255)
+        )
+        self._cmd_alive_reject = tuple(
+            self._make_commands(
+                npm_mode=NPM_X,  # X to indicate rejection
+                npm_r=brightness, npm_g=0, npm_b=0,
+                npr_mode=NPR_SOLID,
+                npr_r=brightness, npr_g=0, npr_b=0,
+                rgb_mode=RGB_SOLID,
+                rgb_r=brightness, rgb_g=0, rgb_b=0,
+            )
+            for brightness in (0, 255)
+        )
+        self._cmd_fault = tuple(
+            self._make_commands(
+                servo_target_1=90.0,
+                servo_target_2=90.0,
+                valve_open=False,
+                rgb_mode=RGB_SOLID,
+                rgb_r=brightness, rgb_g=0, rgb_b=0,
+                npm_mode=NPM_X,
+                npm_r=brightness, npm_g=0, npm_b=0,
+                npr_mode=NPR_SOLID,
+                npr_r=brightness, npr_g=0, npr_b=0,
+                matrix_left=2,  # X
+                matrix_right=2,  # X
+            )
+            for brightness in (0, 255)
+        )
 
     def get_state_name(self) -> str:
         """Get current state name."""
@@ -232,13 +386,16 @@ class StateMachine:
 
     def get_time_in_state(self) -> float:
         """Get time spent in current state."""
-        return time.time() - self._state_start_time
+        return time.monotonic() - self._state_start_time
+
+    def _transition_to(self, new_state: State, now: Optional[float] = None) -> None:
+        """Transition to a new state.
 
-    def _transition_to(self, new_state: State) -> None:
-        """Transition to a new state."""
+        ``now`` is the new state's start time; it defaults to the current tick.
+        """
         self._prev_state = self._state
         self._state = new_state
-        self._state_start_time = time.time()
+        self._state_start_time = self._now if now is None else now
         self._skip_requested = False
         self._current_behavior = None
 
@@ -255,7 +412,7 @@ class StateMachine:
                 self._outcome = self.forced_outcome
                 self.forced_outcome = None  # Reset after use
             else:
-                self._outcome = "ALIVE" if random.random() < self.config.alive_probability else "DEAD"
+                self._outcome = "ALIVE" if self._random() < self.config.alive_probability else "DEAD"
         elif new_state == State.ALIVE:
             # Reset wave for entry animation
             self._start_wave()
@@ -274,51 +431,52 @@ class StateMachine:
             return 90.0
 
         # Animate wave
-        self.arm_wave_position += self._arm_wave_direction * self.config.arm_wave_speed
+        cfg = self.config
+        position = self.arm_wave_position + self._arm_wave_direction * cfg.arm_wave_speed
+        self.arm_wave_position = position
 
-        if self.arm_wave_position >= self.config.arm_wave_max:
+        if position >= cfg.arm_wave_max:
             self._arm_wave_direction = -1
-        elif self.arm_wave_position <= self.config.arm_wave_min:
+        elif position <= cfg.arm_wave_min:
             self._arm_wave_direction = 1
             # One full wave cycle complete
             self._wave_active = False
             self.arm_wave_position = 90.0
             # Record when wave ended so next wave triggers after interval
-            self._last_wave_time = time.time()
+            self._last_wave_time = self._now
 
         return self.arm_wave_position
 
     def _update_shake(self) -> float:
         """Update shake animation. Returns offset to apply to servos."""
-        self._shake_offset += self._shake_direction * self.config.shake_speed
+        offset = self._shake_offset + self._shake_direction * self.config.shake_speed
+        self._shake_offset = offset
 
-        if abs(self._shake_offset) >= self.config.shake_range:
+        limit = self.config.shake_range
+        if offset >= limit or offset <= -limit:
             self._shake_direction = -self._shake_direction
 
-        return self._shake_offset
+        return offset
 
-    def _should_transition_to_inactive(self, face: FaceState) -> bool:
-        """Check if dark long enough to return to INACTIVE."""
-        if face.is_dark:
-            if self._dark_start_time == 0:
-                self._dark_start_time = time.time()
-            elif (time.time() - self._dark_start_time) >= self.config.dark_to_inactive_duration:
-                return True
-        else:
-            self._dark_start_time = 0
-        return False
-
-    def tick(self, face: FaceState, esp: EspState) -> dict:
+    def tick(self, face: FaceState, esp: EspState, now: Optional[float] = None) -> dict:
         """
         Run one tick of the state machine.
 
         Args:
             face: Current face detection state
             esp: Current ESP32 state
+            now: Time for this tick (time.monotonic() if None); lets tests drive
+                the machine deterministically
 
         Returns:
-            Dictionary of commands to send
+            Dictionary of commands to send. May be shared between ticks, so
+            treat it as read-only.
         """
+        self._now = time.monotonic() if now is None else now
+
+        # Shared 8Hz on/off phase for every flashing output this tick
+        self._flash_on = int(self._now * 8) % 2 == 0
+
         # Check for faults
         if not esp.connected and self._state != State.FAULT:
             self._fault_reason = "ESP connection lost"
@@ -328,30 +486,42 @@ class StateMachine:
         if not face.camera_connected and self._state not in (State.INACTIVE, State.FAULT):
             self._fault_reason = "Camera disconnected"
             self._transition_to(State.INACTIVE)
-            return self._tick_inactive(face, esp)
+            return self._run_state(face, esp)
 
-        # Track light duration for INACTIVE -> COLLAPSE transition
+        # Track light duration for INACTIVE -> COLLAPSE and dark duration for
+        # ALIVE/DEAD -> INACTIVE
         if not face.is_dark:
+            self._dark_start_time = 0
+            self._dark_expired = False
             if self._light_start_time == 0:
-                self._light_start_time = time.time()
+                self._light_start_time = self._now
         else:
             self._light_start_time = 0
+            if self._dark_start_time == 0:
+                self._dark_start_time = self._now
+                self._dark_expired = False
+            else:
+                self._dark_expired = (
+                    self._now - self._dark_start_time
+                ) >= self.config.dark_to_inactive_duration
 
         # Run state-specific logic
-        if self._state == State.INACTIVE:
-            return self._tick_inactive(face, esp)
-        elif self._state == State.COLLAPSE:
-            return self._tick_collapse(face, esp)
-        elif self._state == State.ALIVE:
-            return self._tick_alive(face, esp)
-        elif self._state == State.DEAD:
-            return self._tick_dead(face, esp)
-        elif self._state == State.FAULT:
-            return self._tick_fault(face, esp)
-
-        return self._make_commands()
-
-    def _tick_inactive(self, face: FaceState, esp: EspState) -> dict:
+        return self._run_state(face, esp)
+
+    def _run_state(self, face: FaceState, esp: EspState) -> dict:
+        """Run the current state's handler, re-dispatching after transitions.
+
+        A handler that transitions returns None so the new state produces this
+        tick's output. The cap only guards against a transition loop; in
+        practice a tick chains at most FAULT -> INACTIVE -> COLLAPSE -> ALIVE.
+        """
+        for _ in range(len(State)):
+            commands = self._state_dispatch[self._state](face, esp)
+            if commands is not None:
+                return commands
+        return self._static_commands(self._cmd_inactive)
+
+    def _tick_inactive(self, face: FaceState, esp: EspState) -> Optional[dict]:
         """INACTIVE state: door closed, all lights off, CV skipped.
 
         - Entry: Reset _has_dispensed flag
@@ -366,27 +536,15 @@ class StateMachine:
             self._light_start_time = 0
         elif not face.is_dark and self._light_start_time > 0:
             # Check if light has been detected long enough to trigger collapse
-            light_duration = time.time() - self._light_start_time
+            light_duration = self._now - self._light_start_time
             if light_duration >= self.config.light_to_collapse_duration:
                 self._transition_to(State.COLLAPSE)
-                return self._tick_collapse(face, esp)
+                return None
 
         # Everything off
-        return self._make_commands(
-            servo_target_1=90.0,
-            servo_target_2=90.0,
-            valve_open=False,
-            rgb_mode=RGB_SOLID,
-            rgb_r=0, rgb_g=0, rgb_b=0,
-            npm_mode=NPM_OFF,
-            npm_r=0, npm_g=0, npm_b=0,
-            npr_mode=NPR_OFF,
-            npr_r=0, npr_g=0, npr_b=0,
-            matrix_left=0,
-            matrix_right=0,
-        )
+        return self._static_commands(self._cmd_inactive)
 
-    def _tick_collapse(self, face: FaceState, esp: EspState) -> dict:
+    def _tick_collapse(self, face: FaceState, esp: EspState) -> Optional[dict]:
         """COLLAPSE state: quantum collapse animation (2 seconds).
 
         - On entry: Determine outcome (ALIVE/DEAD)
@@ -397,28 +555,14 @@ class StateMachine:
         self._current_behavior = None
 
         # Check for timeout or skip
-        if self.get_time_in_state() >= self.config.collapse_duration or self._skip_requested:
-            if self._outcome == "ALIVE":
-                self._transition_to(State.ALIVE)
-                return self._tick_alive(face, esp)
-            else:
-                self._transition_to(State.DEAD)
-                return self._tick_dead(face, esp)
+        if (self._now - self._state_start_time) >= self.config.collapse_duration or self._skip_requested:
+            self._transition_to(State.ALIVE if self._outcome == "ALIVE" else State.DEAD)
+            return None
 
         # COLLAPSE lighting: fast rainbow everywhere
-        return self._make_commands(
-            servo_target_1=90.0,
-            servo_target_2=90.0,
-            valve_open=False,
-            rgb_mode=RGB_RAINBOW,
-            rgb_r=255, rgb_g=255, rgb_b=255,
-            npm_mode=NPM_RAINBOW,
-            npm_r=255, npm_g=255, npm_b=255,
-            npr_mode=NPR_RAINBOW,
-            npr_r=255, npr_g=255, npr_b=255,
-        )
+        return self._static_commands(self._cmd_collapse)
 
-    def _tick_alive(self, face: FaceState, esp: EspState) -> dict:
+    def _tick_alive(self, face: FaceState, esp: EspState) -> Optional[dict]:
         """ALIVE state: persistent state with sub-behaviors.
 
         Sub-behaviors:
@@ -432,174 +576,112 @@ class StateMachine:
         Exit: 2s of dark -> INACTIVE
         """
         # Check for door close -> INACTIVE
-        if self._should_transition_to_inactive(face):
+        if self._dark_expired:
             self._transition_to(State.INACTIVE)
-            return self._tick_inactive(face, esp)
+            return None
 
         # Determine current behavior
         behavior = self._determine_alive_behavior(face, esp)
         self._current_behavior = behavior
 
         # Execute behavior-specific logic
-        if behavior == AliveBehavior.ENTRY:
-            return self._alive_entry(face, esp)
-        elif behavior == AliveBehavior.DISPENSING:
-            return self._alive_dispensing(face, esp)
-        elif behavior == AliveBehavior.DISPENSE_REJECT:
-            return self._alive_dispense_reject(face, esp)
-        elif behavior == AliveBehavior.DETECTED:
-            return self._alive_detected(face, esp)
-        else:  # IDLE
-            return self._alive_idle(face, esp)
+        return self._alive_dispatch[behavior](face, esp)
 
     def _determine_alive_behavior(self, face: FaceState, esp: EspState) -> AliveBehavior:
-        """Determine which ALIVE sub-behavior to execute."""
+        """Determine which ALIVE sub-behavior to execute (highest priority first)."""
+        now = self._now
+        cfg = self.config
+
         # Entry animation takes priority (first 2 seconds)
-        if self.get_time_in_state() < self.config.alive_entry_duration:
+        if now - self._state_start_time < cfg.alive_entry_duration:
             return AliveBehavior.ENTRY
 
-        # Check if currently in dispense or reject animation
-        if self._dispense_start > 0:
-            dispense_elapsed = time.time() - self._dispense_start
-            if dispense_elapsed < self.config.dispense_flash_duration:
-                return AliveBehavior.DISPENSING
+        # Dispense or reject animation still running
+        if self._dispense_start and now - self._dispense_start < cfg.dispense_flash_duration:
+            return AliveBehavior.DISPENSING
+        if self._reject_start and now - self._reject_start < cfg.reject_flash_duration:
+            return AliveBehavior.DISPENSE_REJECT
 
-        if self._reject_start > 0:
-            reject_elapsed = time.time() - self._reject_start
-            if reject_elapsed < self.config.reject_flash_duration:
-                return AliveBehavior.DISPENSE_REJECT
-
-        # Limit switch handling
-        if esp.limit_triggered:
-            if not self._has_dispensed:
-                # First dispense - requires holding for dispense_hold_duration
-                # AND at least one person must be facing the camera
-                any_facing = face.detected and face.num_facing > 0
-                if any_facing:
-                    if self._limit_switch_hold_start == 0:
-                        # Start tracking hold time
-                        self._limit_switch_hold_start = time.time()
-
-                    hold_elapsed = time.time() - self._limit_switch_hold_start
-                    if hold_elapsed >= self.config.dispense_hold_duration:
-                        # Held long enough while facing - start dispense
-                        self._has_dispensed = True
-                        self._dispense_start = time.time()
-                        self._limit_switch_hold_start = 0  # Reset for next time
-                        return AliveBehavior.DISPENSING
-                    # Still holding, not long enough yet - continue with normal behavior
-                else:
-                    # No one facing camera - reset hold timer (must face to dispense)
-                    self._limit_switch_hold_start = 0
-            else:
-                # Already dispensed - reject immediately (no hold required)
-                self._reject_start = time.time()
-                self._shake_offset = 0.0
-                self._shake_direction = 1
-                return AliveBehavior.DISPENSE_REJECT
+        # Common path: limit switch released - reset hold timer
+        # (tracking cutoff is separate - handled in velocity calc)
+        if not esp.limit_triggered:
+            self._limit_switch_hold_start = 0
+            return AliveBehavior.DETECTED if face.detected else AliveBehavior.IDLE
+
+        # Already dispensed - reject immediately (no hold required)
+        if self._has_dispensed:
+            self._reject_start = now
+            self._shake_offset = 0.0
+            self._shake_direction = 1
+            return AliveBehavior.DISPENSE_REJECT
+
+        # First dispense - requires holding for dispense_hold_duration
+        # AND at least one person must be facing the camera
+        if face.detected and face.num_facing > 0:
+            if not self._limit_switch_hold_start:
+                self._limit_switch_hold_start = now
+            if now - self._limit_switch_hold_start >= cfg.dispense_hold_duration:
+                # Held long enough while facing - start dispense
+                self._has_dispensed = True
+                self._dispense_start = now
+                self._limit_switch_hold_start = 0  # Reset for next time
+                return AliveBehavior.DISPENSING
+            # Still holding, not long enough yet - continue with normal behavior
         else:
-            # Limit switch released - reset hold timer
+            # No one facing camera - reset hold timer (must face to dispense)
             self._limit_switch_hold_start = 0
 
-        # Face detection behavior (tracking cutoff is separate - handled in velocity calc)
-        if face.detected:
-            return AliveBehavior.DETECTED
-
-        return AliveBehavior.IDLE
+        return AliveBehavior.DETECTED if face.detected else AliveBehavior.IDLE
 
     def _alive_entry(self, face: FaceState, esp: EspState) -> dict:
         """ALIVE entry: Wave + solid green, eyes open."""
         # Arm wave animation
         arm_pos = self._update_wave()
 
-        return self._make_commands(
-            servo_target_1=90.0,
-            servo_target_2=arm_pos,
-            valve_open=False,
-            npm_mode=NPM_EYE_OPEN,
-            npm_r=0, npm_g=255, npm_b=0,
-            npr_mode=NPR_SOLID,
-            npr_r=0, npr_g=255, npr_b=0,
-            rgb_mode=RGB_SOLID,
-            rgb_r=0, rgb_g=200, rgb_b=0,
-        )
+        return self._with_servos(self._cmd_alive_green, 90.0, arm_pos)
 
     def _alive_idle(self, face: FaceState, esp: EspState) -> dict:
         """ALIVE idle: No detection - aqua dim, eyes closed."""
-        # Move base back to 90
+        # Move base back to 90, at most 2 degrees per tick
         diff = 90.0 - self.tracking_base_position
-        if abs(diff) > 0.5:
-            move = min(2.0, abs(diff))
-            self.tracking_base_position += move if diff > 0 else -move
+        if diff > 0.5:
+            self.tracking_base_position += diff if diff < 2.0 else 2.0
+        elif diff < -0.5:
+            self.tracking_base_position += diff if diff > -2.0 else -2.0
 
-        return self._make_commands(
-            servo_target_1=self.tracking_base_position,
-            servo_target_2=90.0,
-            valve_open=False,
-            npm_mode=NPM_EYE_CLOSED,
-            npm_r=0, npm_g=180, npm_b=180,  # Aqua
-            npr_mode=NPR_BREATHE,
-            npr_r=0, npr_g=150, npr_b=150,
-            rgb_mode=RGB_SOLID,
-            rgb_r=0, rgb_g=80, rgb_b=80,  # Dim aqua
-        )
+        return self._with_servos(self._cmd_alive_idle, self.tracking_base_position, 90.0)
 
     def _alive_detected(self, face: FaceState, esp: EspState) -> dict:
         """ALIVE detected: Green if facing, yellow-green if not facing."""
         # Update tracking position
-        velocity = self._calculate_tracking_velocity_from_position(face)
-        self.tracking_base_position += velocity
-        self.tracking_base_position = max(
-            self.config.tracking_base_min,
-            min(self.config.tracking_base_max, self.tracking_base_position)
-        )
+        cfg = self.config
+        position = self.tracking_base_position + self._calculate_tracking_velocity_from_position(face)
+        if position < cfg.tracking_base_min:
+            position = cfg.tracking_base_min
+        elif position > cfg.tracking_base_max:
+            position = cfg.tracking_base_max
+        self.tracking_base_position = position
 
         # Periodic arm wave - triggers every arm_wave_interval seconds
         arm_pos = 90.0
-        now = time.time()
-        time_since_last_wave = now - self._last_wave_time
+        time_since_last_wave = self._now - self._last_wave_time
 
         # Start new wave if not currently waving and enough time has passed
-        if not self._wave_active and time_since_last_wave >= self.config.arm_wave_interval:
+        if not self._wave_active and time_since_last_wave >= cfg.arm_wave_interval:
             self._start_wave()
 
         # Update wave animation if active
         if self._wave_active:
             arm_pos = self._update_wave()
 
-        # Check if ANY face is facing the camera
-        any_facing = face.num_facing > 0
-
-        if any_facing:
-            # Green - someone is facing the camera
-            return self._make_commands(
-                servo_target_1=self.tracking_base_position,
-                servo_target_2=arm_pos,
-                valve_open=False,
-                npm_mode=NPM_EYE_OPEN,
-                npm_r=0, npm_g=255, npm_b=0,  # Green
-                npr_mode=NPR_SOLID,
-                npr_r=0, npr_g=255, npr_b=0,
-                rgb_mode=RGB_SOLID,
-                rgb_r=0, rgb_g=200, rgb_b=0,
-            )
-        else:
-            # Yellow-green - detected but not facing
-            return self._make_commands(
-                servo_target_1=self.tracking_base_position,
-                servo_target_2=arm_pos,
-                valve_open=False,
-                npm_mode=NPM_EYE_OPEN,
-                npm_r=180, npm_g=255, npm_b=0,  # Yellow-green
-                npr_mode=NPR_SOLID,
-                npr_r=180, npr_g=255, npr_b=0,
-                rgb_mode=RGB_SOLID,
-                rgb_r=150, rgb_g=200, rgb_b=0,
-            )
+        # Green if ANY face is facing the camera, yellow-green if detected
+        # but not facing
+        template = self._cmd_alive_green if face.num_facing > 0 else self._cmd_alive_yellow
+        return self._with_servos(template, self.tracking_base_position, arm_pos)
 
     def _alive_dispensing(self, face: FaceState, esp: EspState) -> dict:
         """ALIVE dispensing: Valve open, aqua flash with open eyes."""
-        dispense_elapsed = time.time() - self._dispense_start
+        dispense_elapsed = self._now - self._dispense_start
 
         # Check if dispense animation complete
         if dispense_elapsed >= self.config.dispense_flash_duration:
@@ -610,24 +692,14 @@ class StateMachine:
         valve_open = self.dispensing_enabled and (dispense_elapsed < self.config.dispense_duration)
 
         # Fast flashing aqua/cyan (8Hz for obvious blink, full on/off)
-        flash = int(time.time() * 8) % 2 == 0
-        brightness = 255 if flash else 0
-
-        return self._make_commands(
-            servo_target_1=self.tracking_base_position,
-            servo_target_2=90.0,
-            valve_open=valve_open,
-            npm_mode=NPM_EYE_OPEN,  # Open eyes = dispensing (not X)
-            npm_r=0, npm_g=brightness, npm_b=brightness,  # Aqua flash
-            npr_mode=NPR_SOLID,
-            npr_r=0, npr_g=brightness, npr_b=brightness,
-            rgb_mode=RGB_SOLID,
-            rgb_r=0, rgb_g=brightness, rgb_b=brightness,
+        return self._with_servos(
+            self._cmd_alive_dispensing[self._flash_on],
+            self.tracking_base_position, 90.0, valve_open,
         )
 
     def _alive_dispense_reject(self, face: FaceState, esp: EspState) -> dict:
         """ALIVE already dispensed: Shake, red flash, X eyes."""
-        reject_elapsed = time.time() - self._reject_start
+        reject_elapsed = self._now - self._reject_start
 
         # Check if reject animation complete
         if reject_elapsed >= self.config.reject_flash_duration:
@@ -638,22 +710,11 @@ class StateMachine:
         shake = self._update_shake()
 
         # Fast flashing red (8Hz for obvious blink, full on/off)
-        flash = int(time.time() * 8) % 2 == 0
-        brightness = 255 if flash else 0
-
-        return self._make_commands(
-            servo_target_1=90.0 + shake * 0.5,
-            servo_target_2=90.0 + shake,
-            valve_open=False,
-            npm_mode=NPM_X,  # X to indicate rejection
-            npm_r=brightness, npm_g=0, npm_b=0,
-            npr_mode=NPR_SOLID,
-            npr_r=brightness, npr_g=0, npr_b=0,
-            rgb_mode=RGB_SOLID,
-            rgb_r=brightness, rgb_g=0, rgb_b=0,
+        return self._with_servos(
+            self._cmd_alive_reject[self._flash_on], 90.0 + shake * 0.5, 90.0 + shake
         )
 
-    def _tick_dead(self, face: FaceState, esp: EspState) -> dict:
+    def _tick_dead(self, face: FaceState, esp: EspState) -> Optional[dict]:
         """DEAD state: simple static state - no tracking, no dispensing.
 
         Sub-behaviors:
@@ -664,118 +725,67 @@ class StateMachine:
         Exit: 2s of dark -> INACTIVE
         """
         # Check for door close -> INACTIVE
-        if self._should_transition_to_inactive(face):
+        if self._dark_expired:
             self._transition_to(State.INACTIVE)
-            return self._tick_inactive(face, esp)
+            return None
 
         # Determine behavior
         behavior = self._determine_dead_behavior(face, esp)
         self._current_behavior = behavior
 
-        if behavior == DeadBehavior.REJECT:
-            return self._dead_reject(face, esp)
-        else:  # ENTRY or NORMAL (same visuals)
-            return self._dead_normal(face, esp)
+        return self._dead_dispatch[behavior](face, esp)
 
     def _determine_dead_behavior(self, face: FaceState, esp: EspState) -> DeadBehavior:
         """Determine DEAD sub-behavior."""
         # Entry animation (first 2 seconds)
-        if self.get_time_in_state() < self.config.dead_entry_duration:
+        if (self._now - self._state_start_time) < self.config.dead_entry_duration:
             return DeadBehavior.ENTRY
 
         # Check if currently in reject animation
         if self._reject_start > 0:
-            reject_elapsed = time.time() - self._reject_start
+            reject_elapsed = self._now - self._reject_start
             if reject_elapsed < self.config.reject_flash_duration:
                 return DeadBehavior.REJECT
 
         # Limit switch pressed - trigger reject
         if esp.limit_triggered:
-            self._reject_start = time.time()
+            self._reject_start = self._now
             return DeadBehavior.REJECT
 
         return DeadBehavior.NORMAL
 
     def _dead_normal(self, face: FaceState, esp: EspState) -> dict:
         """DEAD normal: Static red + X, no tracking."""
-        return self._make_commands(
-            servo_target_1=90.0,  # No tracking
-            servo_target_2=90.0,
-            valve_open=False,  # Never dispense
-            npm_mode=NPM_X,
-            npm_r=255, npm_g=0, npm_b=0,
-            npr_mode=NPR_SOLID,
-            npr_r=255, npr_g=0, npr_b=0,
-            rgb_mode=RGB_SOLID,
-            rgb_r=200, rgb_g=0, rgb_b=0,
-        )
+        return self._static_commands(self._cmd_dead_normal)
 
     def _dead_reject(self, face: FaceState, esp: EspState) -> dict:
         """DEAD reject: Flash red on limit switch."""
-        reject_elapsed = time.time() - self._reject_start
+        reject_elapsed = self._now - self._reject_start
 
         if reject_elapsed >= self.config.reject_flash_duration:
             self._reject_start = 0
 
         # Fast flashing red (8Hz for obvious blink, full on/off)
-        flash = int(time.time() * 8) % 2 == 0
-        brightness = 255 if flash else 0
+        return self._static_commands(self._cmd_dead_reject[self._flash_on])
 
-        return self._make_commands(
-            servo_target_1=90.0,
-            servo_target_2=90.0,
-            valve_open=False,
-            npm_mode=NPM_X,
-            npm_r=brightness, npm_g=0, npm_b=0,
-            npr_mode=NPR_SOLID,
-            npr_r=brightness, npr_g=0, npr_b=0,
-            rgb_mode=RGB_SOLID,
-            rgb_r=brightness, rgb_g=0, rgb_b=0,
-        )
-
-    def _tick_fault(self, face: FaceState, esp: EspState) -> dict:
+    def _tick_fault(self, face: FaceState, esp: EspState) -> Optional[dict]:
         """FAULT state: error occurred (ESP disconnect)."""
         self._current_behavior = None
 
         # Check if connection restored
         if esp.connected and self.dispensing_enabled:
             self._transition_to(State.INACTIVE)
-            return self._tick_inactive(face, esp)
+            return None
 
         # Fast flash red to indicate fault (8Hz, full on/off)
-        flash = int(time.time() * 8) % 2 == 0
-        brightness = 255 if flash else 0
-
-        return self._make_commands(
-            servo_target_1=90.0,
-            servo_target_2=90.0,
-            valve_open=False,
-            rgb_mode=RGB_SOLID,
-            rgb_r=brightness, rgb_g=0, rgb_b=0,
-            npm_mode=NPM_X,
-            npm_r=brightness, npm_g=0, npm_b=0,
-            npr_mode=NPR_SOLID,
-            npr_r=brightness, npr_g=0, npr_b=0,
-            matrix_left=2,  # X
-            matrix_right=2,  # X
-        )
-
-    def _is_face_trackable(self, face: FaceState) -> bool:
-        """Check if face is large enough to be considered for tracking/detection."""
-        if not face.detected or face.bbox is None:
-            return False
-
-        x, y, w, h = face.bbox
-        frame_width = face.frame_width if face.frame_width > 0 else 640
-        face_width_ratio = w / frame_width
-
-        return face_width_ratio >= self.config.tracking_min_width_ratio
+        return self._static_commands(self._cmd_fault[self._flash_on])
 
     def _calculate_tracking_velocity_from_position(self, face: FaceState) -> float:
         """
         Calculate base rotation velocity from face position in frame.
 
         Uses the face's POSITION in the frame (bbox), not the head's yaw angle.
+        Faces narrower than tracking_min_width_ratio of the frame are ignored.
 
         Args:
             face: Face state with bbox
@@ -783,7 +793,7 @@ class StateMachine:
         Returns:
             Velocity to apply to servo (degrees per tick)
         """
-        if not self._is_face_trackable(face):
+        if not face.detected or face.bbox is None:
             return 0.0
 
         x, y, w, h = face.bbox
@@ -791,6 +801,12 @@ class StateMachine:
         # Use ACTUAL frame dimensions from face state
         frame_width = face.frame_width if face.frame_width > 0 else 640
 
+        cfg = self.config
+
+        # Only track faces large enough to be considered
+        if w / frame_width < cfg.tracking_min_width_ratio:
+            return 0.0
+
         # Calculate face center as fraction of frame (0.0 = left, 1.0 = right)
         face_center_x = (x + w / 2) / frame_width
 
@@ -798,26 +814,17 @@ class StateMachine:
         error = face_center_x - 0.5
 
         # Apply deadzone (as fraction of frame)
-        if abs(error) < self.config.tracking_deadzone:
+        deadzone = cfg.tracking_deadzone
+        if -deadzone < error < deadzone or not self._velocity_scale:
             return 0.0
 
-        # Calculate velocity
-        velocity = -error * 180.0 * self.config.tracking_velocity_gain
-
-        # Apply minimum velocity (ensure servo actually moves when outside deadzone)
-        if velocity > 0 and velocity < self.config.tracking_min_velocity:
-            velocity = self.config.tracking_min_velocity
-        elif velocity < 0 and velocity > -self.config.tracking_min_velocity:
-            velocity = -self.config.tracking_min_velocity
-
-        # Clamp velocity to prevent overshoot
-        velocity = max(-self.config.tracking_max_velocity,
-                      min(self.config.tracking_max_velocity, velocity))
-
-        if self.config.tracking_invert_direction:
-            velocity = -velocity
+        # Calculate velocity (sign and inversion are folded into the scale)
+        velocity = error * self._velocity_scale
 
-        return velocity
+        # Apply minimum speed (ensure servo actually moves when outside deadzone)
+        # and clamp to prevent overshoot, keeping the direction
+        speed = min(max(abs(velocity), cfg.tracking_min_velocity), cfg.tracking_max_velocity)
+        return math.copysign(speed, velocity)
 
     def _make_commands(
         self,
@@ -840,20 +847,15 @@ class StateMachine:
         matrix_left: int = 0,
         matrix_right: int = 0,
     ) -> dict:
-        """Create command dictionary."""
-        # Apply manual valve override (dashboard button can force valve open)
-        # Auto-close after pour duration
-        if self._manual_valve_open:
-            elapsed = time.time() - self._manual_valve_open_time
-            if elapsed >= self.config.dispense_duration:
-                self._manual_valve_open = False
-
-        actual_valve_open = valve_open or self._manual_valve_open
+        """Create command dictionary.
 
+        Used to build the prebuilt templates. The manual valve override is
+        applied per tick by _static_commands() and _with_servos(), not here.
+        """
         return {
             "servo_target_1": servo_target_1,
             "servo_target_2": servo_target_2,
-            "valve_open": actual_valve_open,
+            "valve_open": valve_open,
             "rgb_mode": rgb_mode,
             "rgb_r": rgb_r,
             "rgb_g": rgb_g,
@@ -871,16 +873,49 @@ class StateMachine:
             "matrix_right": matrix_right,
         }
 
+    def _static_commands(self, commands: dict) -> dict:
+        """Return a prebuilt command dict, applying the manual valve override."""
+        if self._manual_valve_active():
+            return {**commands, "valve_open": True}
+        return commands
+
+    def _with_servos(
+        self,
+        commands: dict,
+        servo_target_1: float,
+        servo_target_2: float,
+        valve_open: bool = False,
+    ) -> dict:
+        """Copy a prebuilt command dict with live servo targets and valve state."""
+        result = {
+            **commands,
+            "servo_target_1": servo_target_1,
+            "servo_target_2": servo_target_2,
+        }
+        if valve_open or self._manual_valve_active():
+            result["valve_open"] = True
+        return result
+
+    def _manual_valve_active(self) -> bool:
+        """Manual valve override (dashboard button); auto-closes after pour duration."""
+        if self._manual_valve_open and self._now >= self._manual_valve_deadline:
+            self._manual_valve_open = False
+        return self._manual_valve_open
+
     # --- Operator controls ---
+    # These run on the dashboard thread between ticks, so they never write
+    # _now (owned by tick()). Controls that transition pass their own clock
+    # read so the new state's timers start at the call, not at the previous
+    # tick. ``now`` overrides the clock like tick().
 
-    def force_collapse(self) -> None:
+    def force_collapse(self, now: Optional[float] = None) -> None:
         """Force transition to COLLAPSE state (from any state except FAULT)."""
         if self._state != State.FAULT:
-            self._transition_to(State.COLLAPSE)
+            self._transition_to(State.COLLAPSE, time.monotonic() if now is None else now)
 
-    def force_inactive(self) -> None:
+    def force_inactive(self, now: Optional[float] = None) -> None:
         """Force transition to INACTIVE state."""
-        self._transition_to(State.INACTIVE)
+        self._transition_to(State.INACTIVE, time.monotonic() if now is None else now)
 
     def skip_animation(self) -> None:
         """Skip current animation (COLLAPSE only)."""
@@ -890,21 +925,24 @@ class StateMachine:
         """Emergency stop - disable dispensing."""
         self.dispensing_enabled = False
 
-    def enable_dispensing(self) -> None:
+    def enable_dispensing(self, now: Optional[float] = None) -> None:
         """Re-enable dispensing after emergency stop."""
         self.dispensing_enabled = True
         if self._state == State.FAULT:
-            self._transition_to(State.INACTIVE)
+            self._transition_to(State.INACTIVE, time.monotonic() if now is None else now)
 
     def set_forced_outcome(self, outcome: Optional[str]) -> None:
         """Set forced outcome for next collapse (ALIVE, DEAD, or None for random)."""
-        if outcome in ("ALIVE", "DEAD", None):
+        if outcome in _VALID_OUTCOMES:
             self.forced_outcome = outcome
 
-    def open_valve(self) -> None:
+    def open_valve(self, now: Optional[float] = None) -> None:
         """Manually open the valve (dashboard override). Auto-closes after pour duration."""
+        if now is None:
+            now = time.monotonic()
+        # Deadline first: the tick thread may see the flag as soon as it is set
+        self._manual_valve_deadline = now + self.config.dispense_duration
         self._manual_valve_open = True
-        self._manual_valve_open_time = time.time()
 
     def close_valve(self) -> None:
         """Manually close the valve (clears override)."""
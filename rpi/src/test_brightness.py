@@ -24,6 +24,7 @@ Controls:
 import cv2
 import numpy as np
 import sys
+from collections import deque
 
 # Try to load config values as defaults
 try:
@@ -120,10 +121,10 @@ class BrightnessTester:
         # Crop preview mode: True = show original frame with crop boundaries
         self.show_crop_preview = False
 
-        # History for smoothing display
-        self.brightness_history = []
-        self.variance_history = []
+        # History for smoothing display (deque evicts the oldest reading)
         self.history_size = 10
+        self.brightness_history = deque(maxlen=self.history_size)
+        self.variance_history = deque(maxlen=self.history_size)
 
     def run(self):
         """Run the brightness test UI."""
@@ -198,13 +199,9 @@ class BrightnessTester:
 
             # Update history for smoothed display
             self.brightness_history.append(brightness)
-            if len(self.brightness_history) > self.history_size:
-                self.brightness_history.pop(0)
             avg_brightness = sum(self.brightness_history) / len(self.brightness_history)
 
             self.variance_history.append(std_dev)
-            if len(self.variance_history) > self.history_size:
-                self.variance_history.pop(0)
             avg_variance = sum(self.variance_history) / len(self.variance_history)
 
             # Create display frame
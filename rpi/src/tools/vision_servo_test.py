@@ -21,7 +21,7 @@ import cv2
 import numpy as np
 
 import config
-from vision.face_tracker import FaceTracker
+from vision.face_tracker import FaceResult, FaceTracker
 
 # Try to import local_config overrides
 try:
@@ -180,8 +180,8 @@ class VisionServoTracker:
             result = self.tracker.process(frame)
 
             # Calculate servo target based on face position
-            if result["detected"] and result["bbox"]:
-                x, y, w, h = result["bbox"]
+            if result.detected and result.bbox:
+                x, y, w, h = result.bbox
                 frame_h, frame_w = frame.shape[:2]
 
                 # Calculate face center as fraction of frame (0.0 = left, 1.0 = right)
@@ -235,20 +235,20 @@ class VisionServoTracker:
         cv2.destroyAllWindows()
         print("[Vision] Stopped")
 
-    def _draw_all_faces(self, frame: np.ndarray, result: dict) -> None:
+    def _draw_all_faces(self, frame: np.ndarray, result: FaceResult) -> None:
         """Draw all detected faces with selection indicator."""
-        if not result.get("detected"):
+        if not result.detected:
             return
 
         # Get all faces if available
-        all_faces = result.get("all_faces", [])
-        selected_bbox = result.get("bbox")
+        all_faces = result.all_faces
+        selected_bbox = result.bbox
 
         if not all_faces:
             # Fallback: just draw the selected face
             if selected_bbox:
                 x, y, w, h = selected_bbox
-                color = (0, 255, 0) if result.get("is_facing") else (0, 165, 255)
+                color = (0, 255, 0) if result.is_facing else (0, 165, 255)
                 cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
                 cv2.putText(frame, "SELECTED", (x, y - 5),
                             cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
@@ -287,13 +287,13 @@ class VisionServoTracker:
                             cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 150, 0), 1)
 
         # Show face count
-        num_faces = len(all_faces)
-        num_facing = sum(1 for f in all_faces if f['is_facing'])
+        num_faces = result.num_faces
+        num_facing = result.num_facing
         cv2.putText(frame, f"Faces: {num_faces} ({num_facing} facing)",
                     (10, frame.shape[0] - 40),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
 
-    def _draw_overlay(self, frame: np.ndarray, result: dict) -> None:
+    def _draw_overlay(self, frame: np.ndarray, result: FaceResult) -> None:
         """Draw status overlay on frame."""
         h, w = frame.shape[:2]
 
@@ -305,7 +305,7 @@ class VisionServoTracker:
         line_h = 22
 
         # Detection status
-        if result["detected"]:
+        if result.detected:
             status = "DETECTED"
             color = (0, 255, 0)
         else:
@@ -315,15 +315,15 @@ class VisionServoTracker:
         y += line_h
 
         # Pose angles
-        if result["detected"]:
-            yaw, pitch, roll = result["yaw"], result["pitch"], result["roll"]
+        if result.detected:
+            yaw, pitch, roll = result.yaw, result.pitch, result.roll
             cv2.putText(frame, f"Yaw: {yaw:.1f}  Pitch: {pitch:.1f}  Roll: {roll:.1f}",
                         (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         y += line_h
 
         # Facing status
-        facing = "YES" if result.get("is_facing") else "NO"
-        facing_color = (0, 255, 0) if result.get("is_facing") else (0, 0, 255)
+        facing = "YES" if result.is_facing else "NO"
+        facing_color = (0, 255, 0) if result.is_facing else (0, 0, 255)
         cv2.putText(frame, f"Facing: {facing}", (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, facing_color, 1)
         y += line_h
 
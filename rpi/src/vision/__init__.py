@@ -1,5 +1,5 @@
 """Vision module for face detection and pose estimation."""
 
-from .face_tracker import FaceTracker
+from .face_tracker import FaceResult, FaceTracker
 
-__all__ = ["FaceTracker"]
+__all__ = ["FaceResult", "FaceTracker"]
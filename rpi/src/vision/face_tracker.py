@@ -6,11 +6,12 @@ then MediaPipe FaceLandmarker for precise pose estimation on detected faces.
 
 from __future__ import annotations
 
+import json
 import logging
 import math
 import os
 import urllib.request
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import cv2
 import mediapipe as mp
@@ -35,6 +36,33 @@ YOLO_MODEL_SIZE = getattr(config, 'YOLO_MODEL_SIZE', 's')  # Default to 'small'
 YOLO_FACE_URL = f"https://github.com/lindevs/yolov8-face/releases/latest/download/yolov8{YOLO_MODEL_SIZE}-face-lindevs.pt"
 YOLO_FACE_MODEL = f"yolov8{YOLO_MODEL_SIZE}-face-lindevs.pt"
 
+# LBP cascade (integer features, much cheaper than YOLO on ARM but frontal-only)
+LBP_CASCADE_URL = "https://raw.githubusercontent.com/opencv/opencv/4.x/data/lbpcascades/lbpcascade_frontalface_improved.xml"
+LBP_CASCADE_MODEL = "lbpcascade_frontalface_improved.xml"
+
+# Which detector feeds the MediaPipe pose estimator: 'yolo' or 'lbp'
+FACE_DETECTOR = getattr(config, 'FACE_DETECTOR', 'yolo')
+
+# Optional ultralytics export backend for faster CPU inference on the Pi
+# (e.g. 'ncnn', 'openvino', 'onnx'); None runs the PyTorch .pt model directly
+YOLO_EXPORT_FORMAT = getattr(config, 'YOLO_EXPORT_FORMAT', None)
+YOLO_EXPORT_INT8 = getattr(config, 'YOLO_EXPORT_INT8', False)
+
+# Fraction of frame resolution the detector runs at (1.0 = full resolution)
+DETECT_SCALE = getattr(config, 'DETECT_SCALE', 1.0)
+
+
+def get_detect_imgsz(frame: np.ndarray) -> int:
+    """
+    YOLO input size for a frame as it reaches the detector (after crop).
+
+    The longest side is scaled by DETECT_SCALE and rounded to the model
+    stride. Taken from the frame itself, since the camera may not deliver
+    the configured resolution.
+    """
+    h, w = frame.shape[:2]
+    return max(32, int(round(max(h, w) * DETECT_SCALE / 32)) * 32)
+
 
 def get_models_dir() -> str:
     """Get the models directory path."""
@@ -76,6 +104,44 @@ def download_model_if_needed(url: str, filename: str) -> str:
     return model_path
 
 
+class FaceResult(NamedTuple):
+    """Result of FaceTracker.process() for one frame."""
+
+    detected: bool = False
+    bbox: Optional[tuple[int, int, int, int]] = None  # x, y, w, h
+    landmarks: Optional[np.ndarray] = None  # (N, 3) float32, read-only
+    yaw: float = 0.0  # degrees
+    pitch: float = 0.0  # degrees
+    roll: float = 0.0  # degrees
+    is_facing: bool = False
+    confidence: float = 0.0
+    valid: bool = False  # Passes all validation checks
+    invalid_reasons: tuple[str, ...] = ()
+    num_faces: int = 0  # Faces detected in frame
+    num_facing: int = 0  # Detected faces looking at camera
+    all_faces: tuple[dict, ...] = ()  # Per-face details (for debugging/overlays)
+
+
+NO_FACE = FaceResult()
+
+
+def landmarks_to_array(landmarks_list, width: float, height: float) -> np.ndarray:
+    """
+    Convert MediaPipe normalized landmarks to a pixel-space array.
+
+    Args:
+        landmarks_list: Sequence of MediaPipe landmarks with x, y, z attributes
+        width: Image width used to scale x and z
+        height: Image height used to scale y
+
+    Returns:
+        Contiguous float32 array of shape (N, 3)
+    """
+    landmarks = np.array([(lm.x, lm.y, lm.z) for lm in landmarks_list], dtype=np.float32)
+    landmarks *= np.array((width, height, width), dtype=np.float32)
+    return landmarks
+
+
 class YOLOFaceDetector:
     """Face detector using YOLO-face (ultralytics).
 
@@ -86,12 +152,17 @@ class YOLOFaceDetector:
         """Initialize the YOLO face detector."""
         print(f"[YOLO] Initializing with model size '{YOLO_MODEL_SIZE}' ({YOLO_FACE_MODEL})")
         logger.info(f"Initializing YOLO face detector (model: {YOLO_FACE_MODEL})...")
+        # Input size pinned by a static-shape export; None sizes each frame
+        self.imgsz: Optional[int] = None
+        # Exports are sized from the first real frame, so they happen in detect()
+        self._export_pending = bool(YOLO_EXPORT_FORMAT)
 
         try:
             from ultralytics import YOLO
             model_path = download_model_if_needed(YOLO_FACE_URL, YOLO_FACE_MODEL)
+            self._pt_path = model_path
             print(f"[YOLO] Loading model from: {model_path}")
-            self.model = YOLO(model_path)
+            self.model = YOLO(model_path, task="detect")
             self.available = True
             print(f"[YOLO] Model loaded successfully")
             logger.info(f"YOLO face detector initialized: {YOLO_FACE_MODEL}")
@@ -106,6 +177,63 @@ class YOLOFaceDetector:
             self.model = None
             self.available = False
 
+    @staticmethod
+    def _export_model(model, pt_path: str, imgsz: int) -> str:
+        """
+        Export the .pt model to YOLO_EXPORT_FORMAT once and reuse the result.
+
+        The path ultralytics returns is recorded in a JSON file next to the
+        .pt together with the export settings, so the cache check never has
+        to guess ultralytics' naming and a settings change re-exports.
+
+        Args:
+            model: Loaded ultralytics YOLO model
+            pt_path: Path to the source .pt model
+            imgsz: Input size to export with (must match detect())
+
+        Returns:
+            Path to the exported model, or pt_path if export fails
+        """
+        record_path = f"{os.path.splitext(pt_path)[0]}.export.json"
+        settings = {"format": YOLO_EXPORT_FORMAT, "int8": YOLO_EXPORT_INT8, "imgsz": imgsz}
+
+        try:
+            with open(record_path) as f:
+                record = json.load(f)
+            if record["settings"] == settings and os.path.exists(record["path"]):
+                print(f"[YOLO] Using cached {YOLO_EXPORT_FORMAT} export")
+                return record["path"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # No usable record - export below
+
+        print(f"[YOLO] Exporting model to {YOLO_EXPORT_FORMAT} (int8={YOLO_EXPORT_INT8}, imgsz={imgsz})...")
+        try:
+            exported_path = str(model.export(format=YOLO_EXPORT_FORMAT, int8=YOLO_EXPORT_INT8, imgsz=imgsz))
+        except Exception as e:
+            print(f"[YOLO] Export failed, using .pt model: {e}")
+            logger.warning(f"YOLO export to {YOLO_EXPORT_FORMAT} failed: {e}")
+            return pt_path
+
+        try:
+            with open(record_path, "w") as f:
+                json.dump({"settings": settings, "path": exported_path}, f)
+        except OSError as e:
+            logger.warning(f"Could not record YOLO export path: {e}")
+        return exported_path
+
+    def _load_export(self, imgsz: int) -> None:
+        """Swap in the YOLO_EXPORT_FORMAT model, exported at ``imgsz``."""
+        self._export_pending = False
+        model_path = self._export_model(self.model, self._pt_path, imgsz)
+        if model_path == self._pt_path:
+            return  # Export failed - keep the .pt model and per-frame sizing
+
+        from ultralytics import YOLO
+        print(f"[YOLO] Loading model from: {model_path}")
+        self.model = YOLO(model_path, task="detect")
+        # Static input shape: later frames letterbox to the exported size
+        self.imgsz = imgsz
+
     def detect(self, frame: np.ndarray) -> list[dict]:
         """
         Detect faces in the frame.
@@ -120,15 +248,24 @@ class YOLOFaceDetector:
             return []
 
         try:
-            results = self.model(frame, verbose=False)
+            imgsz = self.imgsz or get_detect_imgsz(frame)
+            if self._export_pending:
+                self._load_export(imgsz)
+
+            # Let ultralytics letterbox straight to the (possibly reduced)
+            # detection size; boxes come back in original frame coordinates
+            results = self.model(frame, imgsz=imgsz, verbose=False)
 
+            # Inference itself runs in native code with the GIL released;
+            # convert each result tensor once so the Python-side work that
+            # holds the GIL stays small
             detections = []
             for result in results:
                 boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        confidence = float(box.conf[0].cpu().numpy())
+                if boxes is not None and len(boxes) > 0:
+                    xyxy = boxes.xyxy.cpu().numpy()
+                    confs = boxes.conf.cpu().numpy()
+                    for (x1, y1, x2, y2), confidence in zip(xyxy.tolist(), confs.tolist()):
                         x, y = int(x1), int(y1)
                         w, h = int(x2 - x1), int(y2 - y1)
                         detections.append({
@@ -142,6 +279,74 @@ class YOLOFaceDetector:
             return []
 
 
+class LBPFaceDetector:
+    """Face detector using OpenCV's LBP cascade.
+
+    Several times cheaper than YOLO on the Pi CPU, at the cost of only
+    finding roughly frontal faces at closer range.
+    """
+
+    SCALE_FACTOR = 1.2
+    MIN_NEIGHBORS = 3
+    MIN_SIZE = 40   # pixels, full-resolution frame
+    MAX_SIZE = 240  # pixels, full-resolution frame
+
+    def __init__(self):
+        """Initialize the LBP cascade detector."""
+        logger.info(f"Initializing LBP face detector ({LBP_CASCADE_MODEL})...")
+
+        try:
+            model_path = download_model_if_needed(LBP_CASCADE_URL, LBP_CASCADE_MODEL)
+            self.cascade = cv2.CascadeClassifier(model_path)
+            self.available = not self.cascade.empty()
+            if not self.available:
+                logger.warning(f"Failed to load LBP cascade from {model_path}")
+        except Exception as e:
+            logger.warning(f"Failed to initialize LBP detector: {e}")
+            self.cascade = None
+            self.available = False
+
+    def detect(self, frame: np.ndarray) -> list[dict]:
+        """
+        Detect faces in the frame.
+
+        Args:
+            frame: BGR image
+
+        Returns:
+            List of detections, each with 'bbox' (x, y, w, h) and 'confidence'
+        """
+        if not self.available:
+            return []
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if DETECT_SCALE != 1.0:
+            gray = cv2.resize(gray, None, fx=DETECT_SCALE, fy=DETECT_SCALE,
+                              interpolation=cv2.INTER_AREA)
+
+        min_size = max(1, int(self.MIN_SIZE * DETECT_SCALE))
+        max_size = max(min_size, int(self.MAX_SIZE * DETECT_SCALE))
+        faces = self.cascade.detectMultiScale(
+            gray,
+            scaleFactor=self.SCALE_FACTOR,
+            minNeighbors=self.MIN_NEIGHBORS,
+            minSize=(min_size, min_size),
+            maxSize=(max_size, max_size),
+        )
+
+        # Cascades give no score; report full confidence and let the
+        # validator/pose checks do the filtering
+        inv_scale = 1.0 / DETECT_SCALE
+        return [
+            {
+                'bbox': (int(x * inv_scale), int(y * inv_scale),
+                         int(w * inv_scale), int(h * inv_scale)),
+                'confidence': 1.0,
+            }
+            for x, y, w, h in faces
+        ]
+
+
 class FacePoseEstimator:
     """Estimates head pose using MediaPipe Face Mesh on cropped face images."""
 
@@ -215,16 +420,6 @@ class FacePoseEstimator:
                 if not results.multi_face_landmarks:
                     return None, None
                 landmarks_list = results.multi_face_landmarks[0].landmark
-
-                # Convert to numpy array
-                landmarks = np.array([
-                    (lm.x * w, lm.y * h, lm.z * w) for lm in landmarks_list
-                ])
-
-                image_points = np.array([
-                    (landmarks_list[idx].x * w, landmarks_list[idx].y * h)
-                    for idx in self.LANDMARK_INDICES
-                ], dtype=np.float64)
             else:
                 mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_image)
                 results = self.face_mesh.detect(mp_image)
@@ -232,15 +427,8 @@ class FacePoseEstimator:
                     return None, None
                 landmarks_list = results.face_landmarks[0]
 
-                # Convert to numpy array
-                landmarks = np.array([
-                    (lm.x * w, lm.y * h, lm.z * w) for lm in landmarks_list
-                ])
-
-                image_points = np.array([
-                    (landmarks_list[idx].x * w, landmarks_list[idx].y * h)
-                    for idx in self.LANDMARK_INDICES
-                ], dtype=np.float64)
+            landmarks = landmarks_to_array(landmarks_list, w, h)
+            image_points = landmarks[self.LANDMARK_INDICES, :2].astype(np.float64)
 
             # Camera matrix
             focal_length = w
@@ -365,8 +553,11 @@ class FaceTracker:
         """Initialize the face tracker."""
         logger.info("Initializing FaceTracker (Hybrid YOLO+MediaPipe)...")
 
-        # Initialize YOLO detector
-        self.yolo_detector = YOLOFaceDetector()
+        # Initialize detector (YOLO by default, LBP cascade if configured)
+        if FACE_DETECTOR == 'lbp':
+            self.detector = LBPFaceDetector()
+        else:
+            self.detector = YOLOFaceDetector()
 
         # Initialize MediaPipe pose estimator
         self.pose_estimator = FacePoseEstimator()
@@ -376,8 +567,8 @@ class FaceTracker:
 
         # Fallback to pure MediaPipe if YOLO not available
         self.fallback_landmarker = None
-        if not self.yolo_detector.available:
-            logger.info("YOLO unavailable, using MediaPipe-only fallback")
+        if not self.detector.available:
+            logger.info("Detector unavailable, using MediaPipe-only fallback")
             self._init_fallback_landmarker()
 
         logger.info("FaceTracker initialized")
@@ -397,7 +588,7 @@ class FaceTracker:
         )
         self.fallback_landmarker = vision.FaceLandmarker.create_from_options(options)
 
-    def process(self, frame: np.ndarray) -> dict:
+    def process(self, frame: np.ndarray) -> FaceResult:
         """
         Process a frame for face detection and pose estimation.
 
@@ -405,45 +596,23 @@ class FaceTracker:
             frame: BGR image from camera
 
         Returns:
-            Dictionary containing:
-                - detected: bool
-                - bbox: (x, y, w, h) or None
-                - landmarks: np.ndarray of shape (478, 3) or None
-                - yaw: float (degrees)
-                - pitch: float (degrees)
-                - roll: float (degrees)
-                - is_facing: bool
-                - confidence: float
-                - valid: bool (passes all validation checks)
-                - invalid_reasons: list of str
+            FaceResult for the best face (NO_FACE if nothing was detected)
         """
-        result = {
-            "detected": False,
-            "bbox": None,
-            "landmarks": None,
-            "yaw": 0.0,
-            "pitch": 0.0,
-            "roll": 0.0,
-            "is_facing": False,
-            "confidence": 0.0,
-            "valid": False,
-            "invalid_reasons": [],
-        }
-
         if frame is None:
-            return result
+            return NO_FACE
 
         frame_height, frame_width = frame.shape[:2]
 
-        # Use YOLO for detection if available
-        if self.yolo_detector.available:
-            detections = self.yolo_detector.detect(frame)
+        # Use YOLO (or LBP) for detection if available
+        if self.detector.available:
+            detections = self.detector.detect(frame)
 
             if not detections:
-                return result
+                return NO_FACE
 
             # Process all faces to get pose information
             processed_faces = []
+            num_facing = 0
             frame_center_x = frame_width / 2
 
             for detection in detections:
@@ -469,6 +638,8 @@ class FaceTracker:
                 if landmarks is not None:
                     landmarks[:, 0] += x1
                     landmarks[:, 1] += y1
+                    # Published without copying - see FaceState
+                    landmarks.flags.writeable = False
 
                 if pose is not None:
                     yaw, pitch, roll = pose
@@ -489,6 +660,8 @@ class FaceTracker:
                     abs(pitch) < config.FACING_PITCH_THRESHOLD
                 )
 
+                num_facing += is_facing
+
                 # Calculate distance from center (face center x to frame center)
                 face_center_x = x + w / 2
                 distance_from_center = abs(face_center_x - frame_center_x)
@@ -511,26 +684,24 @@ class FaceTracker:
             # 2. Closest to center
             best_face = self._select_best_face(processed_faces)
 
-            x, y, w, h = best_face['bbox']
-            result.update({
-                "detected": True,
-                "bbox": (x, y, w, h),
-                "landmarks": best_face['landmarks'],
-                "yaw": best_face['yaw'],
-                "pitch": best_face['pitch'],
-                "roll": best_face['roll'],
-                "is_facing": best_face['is_facing'],
-                "confidence": best_face['confidence'],
-                "valid": best_face['is_valid'],
-                "invalid_reasons": best_face['invalid_reasons'],
-                "all_faces": processed_faces,  # Include all faces for debugging
-            })
-
-        else:
-            # Fallback to MediaPipe-only detection
-            result = self._process_mediapipe_fallback(frame)
+            return FaceResult(
+                detected=True,
+                bbox=best_face['bbox'],
+                landmarks=best_face['landmarks'],
+                yaw=best_face['yaw'],
+                pitch=best_face['pitch'],
+                roll=best_face['roll'],
+                is_facing=best_face['is_facing'],
+                confidence=best_face['confidence'],
+                valid=best_face['is_valid'],
+                invalid_reasons=tuple(best_face['invalid_reasons']),
+                num_faces=len(processed_faces),
+                num_facing=num_facing,
+                all_faces=tuple(processed_faces),
+            )
 
-        return result
+        # Fallback to MediaPipe-only detection
+        return self._process_mediapipe_fallback(frame)
 
     def _select_best_face(self, faces: list[dict]) -> dict:
         """
@@ -550,54 +721,39 @@ class FaceTracker:
         if len(faces) == 1:
             return faces[0]
 
-        # Separate faces into facing and not facing
-        facing_faces = [f for f in faces if f['is_facing']]
-        not_facing_faces = [f for f in faces if not f['is_facing']]
-
-        # Priority 1: If any faces are facing, pick from those
-        if facing_faces:
-            # Priority 2: Among facing faces, pick closest to center
-            best = min(facing_faces, key=lambda f: f['distance_from_center'])
-            logger.debug(f"Selected facing face closest to center (dist={best['distance_from_center']:.1f})")
-            return best
-
-        # No facing faces, pick closest to center from all
-        best = min(not_facing_faces, key=lambda f: f['distance_from_center'])
-        logger.debug(f"No facing faces, selected closest to center (dist={best['distance_from_center']:.1f})")
+        # Single pass: facing faces sort before non-facing ones (False < True),
+        # then closest to center wins
+        best = min(faces, key=lambda f: (not f['is_facing'], f['distance_from_center']))
+        logger.debug(
+            f"Selected {'facing' if best['is_facing'] else 'non-facing'} face "
+            f"closest to center (dist={best['distance_from_center']:.1f})"
+        )
         return best
 
-    def _process_mediapipe_fallback(self, frame: np.ndarray) -> dict:
+    def _process_mediapipe_fallback(self, frame: np.ndarray) -> FaceResult:
         """Process using MediaPipe only (fallback when YOLO unavailable)."""
-        result = {
-            "detected": False,
-            "bbox": None,
-            "landmarks": None,
-            "yaw": 0.0,
-            "pitch": 0.0,
-            "roll": 0.0,
-            "is_facing": False,
-            "confidence": 0.0,
-            "valid": False,
-            "invalid_reasons": [],
-        }
-
         if self.fallback_landmarker is None:
-            return result
+            return NO_FACE
 
         frame_height, frame_width = frame.shape[:2]
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        # Landmarks are normalized, so detect on a downscaled copy and map
+        # back using the full frame size below
+        small = frame
+        if DETECT_SCALE != 1.0:
+            small = cv2.resize(frame, None, fx=DETECT_SCALE, fy=DETECT_SCALE,
+                               interpolation=cv2.INTER_AREA)
+        rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
 
         detection_result = self.fallback_landmarker.detect(mp_image)
 
         if not detection_result.face_landmarks:
-            return result
+            return NO_FACE
 
         face_landmarks = detection_result.face_landmarks[0]
-        landmarks = np.array([
-            [lm.x * frame_width, lm.y * frame_height, lm.z * frame_width]
-            for lm in face_landmarks
-        ])
+        landmarks = landmarks_to_array(face_landmarks, frame_width, frame_height)
+        landmarks.flags.writeable = False  # Published without copying - see FaceState
 
         # Calculate bounding box
         x_coords = landmarks[:, 0]
@@ -619,20 +775,20 @@ class FaceTracker:
 
         confidence = self._calculate_confidence(landmarks)
 
-        result.update({
-            "detected": True,
-            "bbox": bbox,
-            "landmarks": landmarks,
-            "yaw": yaw,
-            "pitch": pitch,
-            "roll": roll,
-            "is_facing": is_facing,
-            "confidence": confidence,
-            "valid": is_facing,
-            "invalid_reasons": [] if is_facing else ["Not facing camera"],
-        })
-
-        return result
+        return FaceResult(
+            detected=True,
+            bbox=bbox,
+            landmarks=landmarks,
+            yaw=yaw,
+            pitch=pitch,
+            roll=roll,
+            is_facing=is_facing,
+            confidence=confidence,
+            valid=is_facing,
+            invalid_reasons=() if is_facing else ("Not facing camera",),
+            num_faces=1,
+            num_facing=int(is_facing),
+        )
 
     def _matrix_to_euler(self, matrix) -> tuple[float, float, float]:
         """Extract Euler angles from facial transformation matrix."""
@@ -672,7 +828,7 @@ class FaceTracker:
     def draw_annotations(
         self,
         frame: np.ndarray,
-        result: dict,
+        result: FaceResult,
         draw_landmarks: bool = True,
         draw_bbox: bool = True,
         draw_pose: bool = True,
@@ -690,37 +846,37 @@ class FaceTracker:
         Returns:
             Annotated frame
         """
-        if not result["detected"]:
+        if not result.detected:
             return frame
 
         annotated = frame.copy()
 
         # Draw bounding box
-        if draw_bbox and result["bbox"]:
-            x, y, w, h = result["bbox"]
-            color = config.COLOR_FACING_YES if result["is_facing"] else config.COLOR_FACING_NO
+        if draw_bbox and result.bbox:
+            x, y, w, h = result.bbox
+            color = config.COLOR_FACING_YES if result.is_facing else config.COLOR_FACING_NO
             cv2.rectangle(annotated, (x, y), (x + w, y + h), color, 2)
 
             # Draw confidence
-            conf_text = f"{result['confidence']:.2f}"
+            conf_text = f"{result.confidence:.2f}"
             cv2.putText(annotated, conf_text, (x, y - 5),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
 
         # Draw landmarks (every 5th for performance)
-        if draw_landmarks and result["landmarks"] is not None:
-            for i in range(0, len(result["landmarks"]), 5):
-                landmark = result["landmarks"][i]
+        if draw_landmarks and result.landmarks is not None:
+            for i in range(0, len(result.landmarks), 5):
+                landmark = result.landmarks[i]
                 lx, ly = int(landmark[0]), int(landmark[1])
                 cv2.circle(annotated, (lx, ly), 1, config.COLOR_LANDMARKS, -1)
 
         # Draw pose axes
-        if draw_pose and result["landmarks"] is not None and len(result["landmarks"]) > 1:
-            nose = result["landmarks"][1]
+        if draw_pose and result.landmarks is not None and len(result.landmarks) > 1:
+            nose = result.landmarks[1]
             nose_point = (int(nose[0]), int(nose[1]))
 
             axis_length = 50
-            yaw_rad = np.radians(result["yaw"])
-            pitch_rad = np.radians(result["pitch"])
+            yaw_rad = np.radians(result.yaw)
+            pitch_rad = np.radians(result.pitch)
 
             # X axis (red)
             x_end = (
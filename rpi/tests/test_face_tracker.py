@@ -0,0 +1,83 @@
+"""Tests for YOLO detection sizing (needs cv2 and mediapipe to import)."""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+try:
+    from vision import face_tracker
+except ImportError:
+    face_tracker = None
+
+
+def make_frame(height: int, width: int) -> np.ndarray:
+    """Blank BGR frame of the given size."""
+    return np.zeros((height, width, 3), dtype=np.uint8)
+
+
+@unittest.skipIf(face_tracker is None, "cv2/mediapipe not installed")
+class DetectImgszTest(unittest.TestCase):
+    """YOLO input size follows the frame the detector actually receives."""
+
+    def test_longest_side_rounded_to_stride(self) -> None:
+        with mock.patch.object(face_tracker, "DETECT_SCALE", 1.0):
+            self.assertEqual(face_tracker.get_detect_imgsz(make_frame(480, 640)), 640)
+            # A cropped frame, not the configured camera size
+            self.assertEqual(face_tracker.get_detect_imgsz(make_frame(300, 600)), 608)
+            self.assertEqual(face_tracker.get_detect_imgsz(make_frame(8, 8)), 32)
+
+    def test_detect_scale_shrinks_the_input(self) -> None:
+        with mock.patch.object(face_tracker, "DETECT_SCALE", 0.5):
+            self.assertEqual(face_tracker.get_detect_imgsz(make_frame(480, 640)), 320)
+
+
+@unittest.skipIf(face_tracker is None, "cv2/mediapipe not installed")
+class YoloDetectSizingTest(unittest.TestCase):
+    """detect() sizes per frame, or pins the size of a lazy export."""
+
+    def make_detector(self, export: bool) -> "face_tracker.YOLOFaceDetector":
+        # Skip __init__: it downloads and loads the real model
+        detector = face_tracker.YOLOFaceDetector.__new__(face_tracker.YOLOFaceDetector)
+        detector.available = True
+        detector.model = mock.Mock(return_value=[])
+        detector.imgsz = None
+        detector._export_pending = export
+        detector._pt_path = "face.pt"
+        return detector
+
+    def test_pt_model_is_sized_per_frame(self) -> None:
+        detector = self.make_detector(export=False)
+        with mock.patch.object(face_tracker, "DETECT_SCALE", 1.0):
+            detector.detect(make_frame(480, 640))
+            detector.detect(make_frame(300, 600))
+        sizes = [call.kwargs["imgsz"] for call in detector.model.call_args_list]
+        self.assertEqual(sizes, [640, 608])
+
+    def test_export_uses_the_first_frame_size(self) -> None:
+        detector = self.make_detector(export=True)
+        exported = mock.Mock(return_value=[])
+        ultralytics = mock.Mock()
+        ultralytics.YOLO.return_value = exported
+
+        with mock.patch.object(face_tracker, "DETECT_SCALE", 1.0), \
+                mock.patch.dict(sys.modules, {"ultralytics": ultralytics}), \
+                mock.patch.object(face_tracker.YOLOFaceDetector, "_export_model",
+                                  return_value="face_ncnn_model") as export_model:
+            detector.detect(make_frame(300, 600))
+            detector.detect(make_frame(480, 640))
+
+        export_model.assert_called_once()
+        self.assertEqual(export_model.call_args.args[2], 608)
+        sizes = [call.kwargs["imgsz"] for call in exported.call_args_list]
+        self.assertEqual(sizes, [608, 608])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""Tests for AppState snapshots, ESP link status and frame ownership."""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from dataclasses import FrozenInstanceError
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import state
+from state import ESP_CONNECTION_TIMEOUT_S, AppState
+
+
+def make_frame(value: int) -> np.ndarray:
+    """Small BGR frame filled with ``value``."""
+    return np.full((4, 6, 3), value, dtype=np.uint8)
+
+
+class SnapshotImmutabilityTest(unittest.TestCase):
+    """Published snapshots are frozen and never change under a reader."""
+
+    def setUp(self) -> None:
+        self.state = AppState()
+
+    def test_face_snapshot_is_frozen(self) -> None:
+        self.state.update_face(detected=True, yaw=5.0)
+        face = self.state.get_face()
+        with self.assertRaises(FrozenInstanceError):
+            face.yaw = 0.0
+
+    def test_held_face_snapshot_survives_updates(self) -> None:
+        self.state.update_face(detected=True, yaw=5.0)
+        held = self.state.get_face()
+        self.state.update_face(detected=False)
+        self.state.clear_face()
+        self.assertTrue(held.detected)
+        self.assertEqual(held.yaw, 5.0)
+        self.assertFalse(self.state.get_face().detected)
+
+    def test_landmarks_are_frozen(self) -> None:
+        landmarks = np.zeros((478, 3), np.float32)
+        self.state.update_face(detected=True, landmarks=landmarks)
+        with self.assertRaises(ValueError):
+            self.state.get_face().landmarks[0, 0] = 1.0
+
+    def test_esp_snapshot_is_replaced_not_mutated(self) -> None:
+        self.state.update_esp_from_packet(0, (90.0, 90.0, 90.0), 0, 0)
+        held = self.state.get_esp()
+        self.state.update_esp_from_packet(1, (10.0, 20.0, 30.0), 1, 0)
+        self.assertFalse(held.limit_triggered)
+        self.assertEqual(held.servo_positions, (90.0, 90.0, 90.0))
+        self.assertTrue(self.state.get_esp().limit_triggered)
+        with self.assertRaises(FrozenInstanceError):
+            held.limit_triggered = True
+
+    def test_command_snapshot_is_replaced_not_mutated(self) -> None:
+        self.state.set_command(servo_target_1=45.0, rgb_r=10)
+        held = self.state.get_command()
+        self.state.set_command(servo_target_2=135.0)
+        self.assertEqual(held.servo_targets, (45.0, 90.0, 90.0))
+        self.assertEqual(self.state.get_command().servo_targets, (45.0, 135.0, 90.0))
+        self.assertEqual(self.state.get_command().rgb_r, 10)
+        with self.assertRaises(FrozenInstanceError):
+            held.rgb_r = 0
+
+
+class EspConnectionTest(unittest.TestCase):
+    """EspState.connected is derived from last_rx_time when read."""
+
+    def test_held_snapshot_goes_stale_without_a_new_packet(self) -> None:
+        app_state = AppState()
+        self.assertFalse(app_state.get_esp().connected)
+
+        app_state.update_esp_from_packet(0, (90.0, 90.0, 90.0), 0, 0, timestamp=100.0)
+        held = app_state.get_esp()
+        with mock.patch.object(state, "time") as fake_time:
+            fake_time.monotonic.return_value = 100.0 + ESP_CONNECTION_TIMEOUT_S
+            self.assertTrue(held.connected)
+            fake_time.monotonic.return_value = 100.0 + ESP_CONNECTION_TIMEOUT_S + 0.01
+            self.assertFalse(held.connected)
+        self.assertIs(app_state.get_esp(), held)
+
+
+class FrameOwnershipTest(unittest.TestCase):
+    """The vision thread reuses its capture buffer; published frames are private."""
+
+    def setUp(self) -> None:
+        self.state = AppState()
+
+    def test_processed_frame_is_a_read_only_copy(self) -> None:
+        capture = make_frame(1)
+        self.state.update_face(detected=False, processed_frame=capture)
+        published = self.state.get_face().processed_frame
+        self.assertFalse(np.shares_memory(published, capture))
+        self.assertFalse(published.flags.writeable)
+        with self.assertRaises(ValueError):
+            published[0, 0, 0] = 0
+
+    def test_reused_capture_buffer_does_not_touch_held_frames(self) -> None:
+        capture = make_frame(1)
+        self.state.update_face(detected=False, processed_frame=capture)
+        first = self.state.get_face().processed_frame
+
+        # Producer decodes the next frame into the same buffer
+        capture[...] = 2
+        self.state.update_face(detected=False, processed_frame=capture)
+        second = self.state.get_face().processed_frame
+
+        capture[...] = 3
+        self.assertTrue((first == 1).all())
+        self.assertTrue((second == 2).all())
+        self.assertFalse(np.shares_memory(first, second))
+
+    def test_update_without_frame_keeps_previous_frame(self) -> None:
+        self.state.update_face(detected=False, processed_frame=make_frame(7))
+        frame = self.state.get_face().processed_frame
+        self.state.update_face(detected=True)
+        self.assertIs(self.state.get_face().processed_frame, frame)
+
+    def test_get_all_returns_the_face_frame_without_copying(self) -> None:
+        self.state.update_face(detected=False, processed_frame=make_frame(5))
+        frame, face, _esp, _command, _system = self.state.get_all()
+        self.assertIs(frame, face.processed_frame)
+
+    def test_raw_frame_is_published_read_only(self) -> None:
+        raw = make_frame(9)
+        self.state.update_frame(raw, frame_id=1)
+        self.assertIs(self.state.get_frame().raw_frame, raw)
+        self.assertFalse(raw.flags.writeable)
+
+
+if __name__ == "__main__":
+    unittest.main()
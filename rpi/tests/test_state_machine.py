@@ -0,0 +1,213 @@
+"""Deterministic timing tests for the dispenser state machine.
+
+Every tick passes an explicit ``now`` so the tests run on a fake clock;
+durations are binary-exact so boundaries land on a tick.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import state_machine
+from state import EspState, FaceState
+from state_machine import StateMachine, StateMachineConfig
+
+DT = 0.25    # Tick period on the fake clock
+START = 100.0  # Non-zero: 0 means "unset" for the machine's timers
+
+
+def make_config() -> StateMachineConfig:
+    """Config with fixed durations, independent of config.py."""
+    return StateMachineConfig(
+        light_to_collapse_duration=1.0,
+        collapse_duration=2.0,
+        alive_entry_duration=2.0,
+        dead_entry_duration=2.0,
+        dark_to_inactive_duration=2.0,
+        dispense_duration=3.0,
+        reject_flash_duration=1.0,
+    )
+
+
+def esp(limit: bool = False) -> EspState:
+    """ESP snapshot that counts as connected (connected uses the real clock)."""
+    return EspState(limit_triggered=limit, last_rx_time=time.monotonic())
+
+
+LIGHT = FaceState(camera_connected=True, is_dark=False)
+DARK = FaceState(camera_connected=True, is_dark=True)
+
+
+class StateMachineTimingTest(unittest.TestCase):
+    """State durations and transitions on a fake clock."""
+
+    def setUp(self) -> None:
+        self.sm = StateMachine(make_config())
+        self.now = START
+
+    def tick(self, face: FaceState = LIGHT, limit: bool = False) -> dict:
+        commands = self.sm.tick(face, esp(limit), self.now)
+        self.now += DT
+        return commands
+
+    def run_until(self, end: float, face: FaceState = LIGHT, limit: bool = False) -> dict:
+        """Tick up to but not including ``end``; return the last commands."""
+        commands = {}
+        while self.now < end:
+            commands = self.tick(face, limit)
+        return commands
+
+    def enter_outcome(self, outcome: str) -> float:
+        """Drive INACTIVE -> COLLAPSE -> outcome; return the outcome's start time."""
+        self.sm.set_forced_outcome(outcome)
+        light_start = self.now
+        self.run_until(light_start + 1.0)
+        self.assertEqual(self.sm.get_state_name(), "INACTIVE")
+        self.tick()
+        self.assertEqual(self.sm.get_state_name(), "COLLAPSE")
+
+        collapse_start = light_start + 1.0
+        self.run_until(collapse_start + 2.0)
+        self.assertEqual(self.sm.get_state_name(), "COLLAPSE")
+        self.tick()
+        self.assertEqual(self.sm.get_state_name(), outcome)
+        return collapse_start + 2.0
+
+    def test_starts_inactive_and_stays_dark(self) -> None:
+        self.run_until(START + 10.0, face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "INACTIVE")
+
+    def test_alive_entry_then_idle(self) -> None:
+        alive_start = self.enter_outcome("ALIVE")
+        self.assertEqual(self.sm.get_behavior_name(), "ENTRY")
+
+        self.run_until(alive_start + 2.0)
+        self.assertEqual(self.sm.get_behavior_name(), "ENTRY")
+        self.tick()
+        self.assertEqual(self.sm.get_behavior_name(), "IDLE")
+
+    def test_dead_entry_then_normal_and_reject(self) -> None:
+        dead_start = self.enter_outcome("DEAD")
+        self.assertEqual(self.sm.get_behavior_name(), "ENTRY")
+
+        self.run_until(dead_start + 2.0)
+        self.assertEqual(self.sm.get_behavior_name(), "ENTRY")
+        self.tick()
+        self.assertEqual(self.sm.get_behavior_name(), "NORMAL")
+
+        # Limit switch starts a reject flash that lasts reject_flash_duration
+        reject_start = self.now
+        self.tick(limit=True)
+        self.assertEqual(self.sm.get_behavior_name(), "REJECT")
+        self.run_until(reject_start + 1.0)
+        self.assertEqual(self.sm.get_behavior_name(), "REJECT")
+        self.tick()
+        self.assertEqual(self.sm.get_behavior_name(), "NORMAL")
+
+    def test_dark_returns_to_inactive(self) -> None:
+        self.enter_outcome("ALIVE")
+        dark_start = self.now
+        self.run_until(dark_start + 2.0, face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "ALIVE")
+        self.tick(face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "INACTIVE")
+
+    def test_dark_during_collapse_counts_toward_inactive(self) -> None:
+        self.sm.set_forced_outcome("ALIVE")
+        self.run_until(START + 1.0)
+        self.tick()
+        self.assertEqual(self.sm.get_state_name(), "COLLAPSE")
+
+        # Door closes one tick into COLLAPSE; the dark timer keeps running
+        dark_start = self.now
+        collapse_end = START + 1.0 + 2.0
+        self.run_until(collapse_end, face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "COLLAPSE")
+        self.tick(face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "ALIVE")
+
+        self.run_until(dark_start + 2.0, face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "ALIVE")
+        self.tick(face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "INACTIVE")
+
+    def test_dark_through_collapse_skips_entry(self) -> None:
+        self.run_until(START + 1.0, face=DARK)
+        # Operator forces COLLAPSE right after the last dark tick
+        forced_at = self.now - DT
+        self.sm.set_forced_outcome("DEAD")
+        self.sm.force_collapse(now=forced_at)
+        collapse_end = forced_at + 2.0
+
+        # Dark for the whole COLLAPSE: the outcome hands straight to INACTIVE
+        behaviors = []
+        while self.now <= collapse_end:
+            self.tick(face=DARK)
+            behaviors.append(self.sm.get_behavior_name())
+        self.assertEqual(self.sm.get_state_name(), "INACTIVE")
+        self.assertNotIn("ENTRY", behaviors)
+
+    def test_dark_timer_restarts_each_cycle(self) -> None:
+        self.enter_outcome("ALIVE")
+        self.run_until(self.now + 2.0 + DT, face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "INACTIVE")
+
+        # A fresh cycle must not inherit the previous dark spell's start
+        self.enter_outcome("ALIVE")
+        dark_start = self.now
+        self.run_until(dark_start + 2.0, face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "ALIVE")
+        self.tick(face=DARK)
+        self.assertEqual(self.sm.get_state_name(), "INACTIVE")
+
+    def test_esp_disconnect_faults(self) -> None:
+        self.sm.tick(LIGHT, EspState(), self.now)
+        self.assertEqual(self.sm.get_state_name(), "FAULT")
+        self.tick()
+        self.assertEqual(self.sm.get_state_name(), "INACTIVE")
+
+    def test_forced_collapse_times_from_the_call(self) -> None:
+        self.tick(face=DARK)
+        # Operator call lands between ticks, half a period after the last one
+        forced_at = self.now - DT / 2
+        self.sm.set_forced_outcome("DEAD")
+        self.sm.force_collapse(now=forced_at)
+        self.assertEqual(self.sm.get_state_name(), "COLLAPSE")
+
+        # A stale start (the previous tick) would end COLLAPSE one tick early
+        self.run_until(forced_at + 2.0)
+        self.assertEqual(self.sm.get_state_name(), "COLLAPSE")
+        self.tick()
+        self.assertEqual(self.sm.get_state_name(), "DEAD")
+
+    def open_valve_at(self, when: float) -> None:
+        """Press the dashboard valve button at ``when`` on the fake clock."""
+        with mock.patch.object(state_machine, "time") as fake_time:
+            fake_time.monotonic.return_value = when
+            self.sm.open_valve()
+
+    def test_manual_valve_closes_after_pour_duration(self) -> None:
+        self.assertFalse(self.tick(face=DARK)["valve_open"])
+        opened_at = self.now
+        self.open_valve_at(opened_at)
+
+        while self.now < opened_at + 3.0:
+            self.assertTrue(self.tick(face=DARK)["valve_open"])
+        self.assertFalse(self.tick(face=DARK)["valve_open"])
+        self.assertFalse(self.sm.is_valve_manually_open())
+
+    def test_close_valve_clears_override(self) -> None:
+        self.open_valve_at(self.now)
+        self.assertTrue(self.tick(face=DARK)["valve_open"])
+        self.sm.close_valve()
+        self.assertFalse(self.tick(face=DARK)["valve_open"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Tests for batched UART transmit against the mock ESP32."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from comm.uart_comm import MockSerial, UartComm
+from state import AppState
+
+
+class RecordingSerial(MockSerial):
+    """MockSerial that records each write and can fail the next one."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[bytes] = []
+        self.fail_next = False
+
+    def write(self, data: bytes) -> int:
+        if self.fail_next:
+            self.fail_next = False
+            raise OSError("write timeout")
+        self.writes.append(data)
+        return super().write(data)
+
+    def due_status(self) -> None:
+        """Make the next in_waiting poll emit a status packet."""
+        self._last_update -= 1.0
+
+
+class BatchedTransmitTest(unittest.TestCase):
+    """One write per TX period; the mock parses every line in it."""
+
+    def setUp(self) -> None:
+        self.state = AppState()
+        self.comm = UartComm(self.state, threading.Event())
+        # Hardware path: transmit errors propagate so run() reconnects
+        self.comm.mock_mode = False
+        self.serial = RecordingSerial()
+        self.comm.serial = self.serial
+
+    def test_mock_parses_every_line_of_one_write(self) -> None:
+        self.serial.write(b"$SRV,80.0,90.0,100.0\n$LGT,1\n$VLV,1\n")
+        self.serial.due_status()
+        self.comm._receive(time.monotonic())
+
+        esp = self.state.get_esp()
+        self.assertTrue(esp.connected)
+        self.assertEqual(esp.light_state, 1)
+        self.assertEqual(esp.valve_open, 1)
+        # Servos step 5 degrees toward the target; status adds +/-0.5 noise
+        for actual, expected in zip(esp.servo_positions, (85.0, 90.0, 95.0)):
+            self.assertAlmostEqual(actual, expected, delta=0.5)
+        self.assertEqual(self.state.get_system().uart_rx_count, 1)
+
+    def test_transmit_batches_changes_into_one_write(self) -> None:
+        self.state.set_command(light_command=1, valve_open=True)
+        self.comm._transmit()
+
+        self.assertEqual(len(self.serial.writes), 1)
+        lines = self.serial.writes[0].decode("ascii").splitlines()
+        self.assertTrue(lines[0].startswith("$SRV,"))
+        self.assertIn("$LGT,1", lines)
+        self.assertIn("$VLV,1", lines)
+        self.assertEqual(self.serial._light_state, 1)
+        self.assertEqual(self.serial._valve_open, 1)
+        self.assertEqual(self.state.get_system().uart_tx_count, len(lines))
+
+        # Unchanged values are not resent; only the servo heartbeat goes out
+        self.comm._transmit()
+        self.assertEqual(self.serial.writes[1].decode("ascii").splitlines(), lines[:1])
+
+    def test_failed_write_resends_everything(self) -> None:
+        self.state.set_command(light_command=1, valve_open=True)
+        self.comm._transmit()
+        sent = self.serial.writes[0]
+
+        self.serial.fail_next = True
+        with self.assertLogs("comm.uart_comm", "ERROR"), self.assertRaises(OSError):
+            self.comm._transmit()
+        self.assertEqual(len(self.serial.writes), 1)
+
+        # Nothing changed, but the lost batch may have been partial
+        self.comm._transmit()
+        self.assertEqual(self.serial.writes[1], sent)
+
+
+if __name__ == "__main__":
+    unittest.main()